@@ -1,63 +1,197 @@
+from heapq import heappush, heappop
 from math import inf
 from code.algorithms.base_algorithm import SearchAlgorithm
 from code.heartofitall.search_results import SearchResult
-from code.heartofitall.priority_queue import PriorityQueue
-from code.utilities.heuristics import haversine_distance
+from code.utilities.heuristics import haversine_to_goal
 
 
 class AStar(SearchAlgorithm):
-
-    # Heuristic function
-    # Returns the estimated cost of reaching the goal from the current node
-    # h(n) = distance from n to goal
-    def _h(self, a: str, b: str) -> float:
-        lat1, lon1 = self.graph.get_coordinates(a)
-        lat2, lon2 = self.graph.get_coordinates(b)
-        return haversine_distance(lat1, lon1, lat2, lon2)
+    __slots__ = ()
 
     def search(self) -> SearchResult:
         self._start_timer()
 
-        frontier = PriorityQueue()
-        frontier.push(self.start, 0.0)
+        # work on int node ids so g / came_from are flat lists instead of str-keyed dicts
+        ctx = self.ctx
+        indptr, indices, weights = ctx.indptr, ctx.indices, ctx.weights
+        start, goal = ctx.start_id, ctx.goal_id
+        n = self.graph.num_nodes
+
+        # Heuristic
+        # h[i] = estimated cost of reaching the goal from node i (haversine distance)
+        # the goal is fixed, so it is computed once per query (shared through ctx)
+        h = ctx.h_to_goal
+
+        # raw heap of (f, push order, node); the push order keeps ties FIFO
+        frontier = [(0.0, 0, start)]
+        pushed = 1
 
-        came_from = {}
-        g = {self.start: 0.0}
+        came_from = [-1] * n
+        g = [inf] * n
+        g[start] = 0.0
+        nodes_expanded = self.nodes_expanded  # local counter, written back before returning
 
-        while not frontier.is_empty():
-            current = frontier.pop()
+        while frontier:
+            f_current, _, current = heappop(frontier)
 
-            if current == self.goal:
+            # lazy deletion: a better g was found for this node after the entry was pushed
+            # (no closed set here: haversine is only consistent up to rounding of the
+            # edge distances, so an expanded node may still be reached more cheaply
+            # and has to be allowed back onto the frontier)
+            if f_current > g[current] + h[current]:
+                continue
+
+            if current == goal:
                 runtime = self._stop_timer()
-                path = self._reconstruct_path(came_from, current)
+                self.nodes_expanded = nodes_expanded
+                path = self._reconstruct_path_ids(came_from, current)
                 return SearchResult(
                     algorithm_name="A*",
                     start=self.start,
                     goal=self.goal,
                     path=path,
                     cost=g[current],
-                    nodes_expanded=self.nodes_expanded,
+                    nodes_expanded=nodes_expanded,
                     runtime=runtime,
                     is_optimal=True
                 )
 
-            self.nodes_expanded += 1
-            for nbr, w in self.graph.get_neighbors(current).items():
-                tentative = g[current] + w
-                if tentative < g.get(nbr, inf):
+            nodes_expanded += 1
+            g_current = g[current]
+            for k in range(indptr[current], indptr[current + 1]):
+                nbr = indices[k]
+                tentative = g_current + weights[k]
+                if tentative < g[nbr]:
+                    f = tentative + h[nbr]
+                    # g[goal] is an upper bound once the goal has been generated:
+                    # an entry with f >= g[goal] would pop after the goal's, so skip it
+                    if f >= g[goal]:
+                        continue
                     g[nbr] = tentative
                     came_from[nbr] = current
-                    f = tentative + self._h(nbr, self.goal)
-                    frontier.push(nbr, f)
+                    heappush(frontier, (f, pushed, nbr))
+                    pushed += 1
 
         runtime = self._stop_timer()
+        self.nodes_expanded = nodes_expanded
         return SearchResult(
             algorithm_name="A*",
             start=self.start,
             goal=self.goal,
             path=[],
             cost=float("inf"),
-            nodes_expanded=self.nodes_expanded,
+            nodes_expanded=nodes_expanded,
             runtime=runtime,
             is_optimal=False
-        )
\ No newline at end of file
+        )
+
+    def search_bidirectional(self) -> SearchResult:
+        """
+        Bidirectional A*: one search forward from start, one backward from goal,
+        each over the graph's CSR arrays.
+
+        Both sides use the balanced potential p(n) = (h_goal(n) - h_start(n)) / 2
+        (backward uses -p) so they agree on reduced edge costs, which makes the
+        bidirectional Dijkstra stopping rule valid:
+        stop once top_forward + top_backward >= best path seen so far.
+        """
+        self._start_timer()
+
+        ctx = self.ctx
+        fwd_indptr, fwd_indices, fwd_weights = ctx.indptr, ctx.indices, ctx.weights
+        bwd_indptr, bwd_indices, bwd_weights = self.graph.get_reverse_csr()
+        start, goal = ctx.start_id, ctx.goal_id
+        n = self.graph.num_nodes
+
+        lats, lons = self.graph.get_coordinate_arrays()
+        h_goal = ctx.h_to_goal
+        h_start = haversine_to_goal(lats, lons, start)
+        p = [(hg - hs) / 2 for hg, hs in zip(h_goal, h_start)]
+
+        g_f = [inf] * n
+        g_b = [inf] * n
+        came_from_f = [-1] * n
+        came_from_b = [-1] * n  # successor towards the goal
+        g_f[start] = 0.0
+        g_b[goal] = 0.0
+
+        open_f = [(p[start], 0, start)]
+        open_b = [(-p[goal], 0, goal)]
+        pushed = 1
+
+        best = 0.0 if start == goal else inf
+        meet = start if start == goal else -1
+        nodes_expanded = self.nodes_expanded
+
+        while open_f and open_b:
+            if open_f[0][0] + open_b[0][0] >= best:
+                break
+
+            # Expand the side with the smaller key
+            if open_f[0][0] <= open_b[0][0]:
+                key, _, current = heappop(open_f)
+                if key > g_f[current] + p[current]:
+                    continue  # stale entry
+                nodes_expanded += 1
+                g_current = g_f[current]
+                for k in range(fwd_indptr[current], fwd_indptr[current + 1]):
+                    nbr = fwd_indices[k]
+                    tentative = g_current + fwd_weights[k]
+                    if tentative < g_f[nbr]:
+                        g_f[nbr] = tentative
+                        came_from_f[nbr] = current
+                        heappush(open_f, (tentative + p[nbr], pushed, nbr))
+                        pushed += 1
+                        if tentative + g_b[nbr] < best:
+                            best = tentative + g_b[nbr]
+                            meet = nbr
+            else:
+                key, _, current = heappop(open_b)
+                if key > g_b[current] - p[current]:
+                    continue  # stale entry
+                nodes_expanded += 1
+                g_current = g_b[current]
+                for k in range(bwd_indptr[current], bwd_indptr[current + 1]):
+                    nbr = bwd_indices[k]
+                    tentative = g_current + bwd_weights[k]
+                    if tentative < g_b[nbr]:
+                        g_b[nbr] = tentative
+                        came_from_b[nbr] = current
+                        heappush(open_b, (tentative - p[nbr], pushed, nbr))
+                        pushed += 1
+                        if g_f[nbr] + tentative < best:
+                            best = g_f[nbr] + tentative
+                            meet = nbr
+
+        runtime = self._stop_timer()
+        self.nodes_expanded = nodes_expanded
+
+        if meet == -1:
+            return SearchResult(
+                algorithm_name="A*",
+                start=self.start,
+                goal=self.goal,
+                path=[],
+                cost=float("inf"),
+                nodes_expanded=nodes_expanded,
+                runtime=runtime,
+                is_optimal=False
+            )
+
+        # start -> meet from the forward tree, then meet -> goal from the backward tree
+        path = self._reconstruct_path_ids(came_from_f, meet)
+        current = came_from_b[meet]
+        while current != -1:
+            path.append(self.graph.get_node_name(current))
+            current = came_from_b[current]
+
+        return SearchResult(
+            algorithm_name="A*",
+            start=self.start,
+            goal=self.goal,
+            path=path,
+            cost=best,
+            nodes_expanded=nodes_expanded,
+            runtime=runtime,
+            is_optimal=True
+        )
@@ -3,17 +3,58 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
 import time
-from typing import Dict, List
+from typing import Dict, List, Optional
 from code.heartofitall.graph import Graph
 from code.heartofitall.search_results import SearchResult
+from code.utilities.heuristics import haversine_to_goal
+
+
+# per-query data shared by every alg run on the same (graph, start, goal):
+# the CSR arrays, the int ids of start / goal and the haversine-to-goal table
+# h_to_goal is only built on first use, so uninformed algs never pay for it
+class SearchContext:
+    __slots__ = ("graph", "indptr", "indices", "weights", "start_id", "goal_id", "_h_to_goal")
+
+    def __init__(self, graph: Graph, start: str, goal: str) -> None:
+        self.graph = graph
+        self.indptr, self.indices, self.weights = graph.get_csr()
+        self.start_id = graph.get_node_id(start)
+        self.goal_id = graph.get_node_id(goal)
+        self._h_to_goal: Optional[List[float]] = None
+
+    @property
+    def h_to_goal(self) -> List[float]:
+        if self._h_to_goal is None:
+            coords = self.graph.get_coordinate_matrix()
+            if coords is not None:
+                lats, lons = coords[:, 0], coords[:, 1]  # views, no per-query list -> array copy
+            else:
+                lats, lons = self.graph.get_coordinate_arrays()
+            self._h_to_goal = haversine_to_goal(lats, lons, self.goal_id)
+        return self._h_to_goal
+
+
+def prepare_search_context(graph: Graph, start: str, goal: str) -> SearchContext:
+    return SearchContext(graph, start, goal)
 
 
 # constructor
+# __slots__ keeps self.graph / self.nodes_expanded etc. as fixed slots instead of a __dict__
+# (subclasses declare their own __slots__, empty unless they add state)
 class SearchAlgorithm(ABC):
-    def __init__(self, graph: Graph, start: str, goal: str) -> None:
+    __slots__ = ("graph", "start", "goal", "ctx", "nodes_expanded", "_t0_ns")
+
+    # ctx lets several algs on the same query share one SearchContext (see run_compare)
+    def __init__(self, graph: Graph, start: str, goal: str, ctx: Optional[SearchContext] = None) -> None:
+        if ctx is None:
+            ctx = SearchContext(graph, start, goal)
+        elif ctx.graph is not graph or ctx.start_id != graph.get_node_id(start) \
+                or ctx.goal_id != graph.get_node_id(goal):
+            raise ValueError("search context was prepared for a different graph or query")
         self.graph = graph
         self.start = start
         self.goal = goal
+        self.ctx = ctx
         self.nodes_expanded = 0
         self._t0_ns = 0
 
@@ -34,6 +75,29 @@ class SearchAlgorithm(ABC):
         path.reverse()
         return path
 
+    # same as above for the int-id algs: came_from[i] is the parent id of i (-1 for none)
+    # maps the ids back to city names at the end
+    def _reconstruct_path_ids(self, came_from: List[int], current: int) -> List[str]:
+        ids = [current]
+        while came_from[current] != -1:
+            current = came_from[current]
+            ids.append(current)
+        ids.reverse()
+        return [self.graph.get_node_name(i) for i in ids]
+
+    # path cost from the parent-edge costs recorded during the search
+    # (edge_cost[i] = distance from came_from[i] to i), no distance lookups needed
+    # summed start -> goal so the float matches adding get_distance along the path
+    def _path_cost_ids(self, came_from: List[int], edge_cost: List[float], current: int) -> float:
+        costs = []
+        while came_from[current] != -1:
+            costs.append(edge_cost[current])
+            current = came_from[current]
+        total = 0.0
+        for c in reversed(costs):
+            total += c
+        return total
+
 
     # to be implemented by all subclass search algs
     #returns a search result object containing the path found and total cost
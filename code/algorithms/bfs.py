@@ -1,39 +1,54 @@
-from collections import deque
-from typing import Dict, Set
-import time
+from typing import List
 from code.algorithms.base_algorithm import SearchAlgorithm
-from code.heartofitall.graph import Graph
 from code.heartofitall.search_results import SearchResult
 
 
-class BFS:
-    def __init__(self, graph: Graph, start: str, goal: str):
-        self.graph = graph
-        self.start = start
-        self.goal = goal
-        self.nodes_expanded = 0
+class BFS(SearchAlgorithm):
+    __slots__ = ()
 
     def search(self) -> SearchResult:
-        start_time = time.time()
+        self._start_timer()
 
-        frontier = deque([self.start])
-        came_from: Dict[str, str] = {}
-        visited: Set[str] = {self.start}
+        # int node ids over the graph's CSR arrays
+        ctx = self.ctx
+        indptr, indices, weights = ctx.indptr, ctx.indices, ctx.weights
+        start, goal = ctx.start_id, ctx.goal_id
+        n = self.graph.num_nodes
 
-        while frontier:
-            u = frontier.popleft()
-            if u == self.goal:
-                break
-            self.nodes_expanded += 1
-            for v, _dist in self.graph.get_neighbors(u).items():
-                if v not in visited:
-                    visited.add(v)
+        # every node is enqueued at most once, so the FIFO is a flat buffer of
+        # size n with a head index, no deque needed
+        frontier: List[int] = [0] * n
+        frontier[0] = start
+        head, tail = 0, 1
+        came_from: List[int] = [-1] * n
+        edge_cost: List[float] = [0.0] * n  # distance from came_from[v] to v
+        visited: List[bool] = [False] * n
+        visited[start] = True
+        nodes_expanded = self.nodes_expanded
+
+        # goal test when a node is generated: the goal's parent is fixed the first
+        # time it's seen, so there's no need to queue it and wait for it to come out
+        found = start == goal
+        while head < tail and not found:
+            u = frontier[head]
+            head += 1
+            nodes_expanded += 1
+            for k in range(indptr[u], indptr[u + 1]):
+                v = indices[k]
+                if not visited[v]:
+                    visited[v] = True
                     came_from[v] = u
-                    frontier.append(v)
+                    edge_cost[v] = weights[k]
+                    if v == goal:
+                        found = True
+                        break
+                    frontier[tail] = v
+                    tail += 1
 
-        runtime = time.time() - start_time
+        self.nodes_expanded = nodes_expanded
+        runtime = self._stop_timer()
 
-        if self.goal not in came_from and self.goal != self.start:
+        if not found:
             return SearchResult(
                 algorithm_name="BFS",
                 start=self.start,
@@ -45,12 +60,10 @@ class BFS:
                 is_optimal=False
             )
 
-        path = [self.start] if self.start == self.goal else self._reconstruct_path(came_from, self.goal)
+        path = self._reconstruct_path_ids(came_from, goal)
 
-        # BFS path cost = sum of road distances along path
-        cost = 0.0
-        for a, b in zip(path, path[1:]):
-            cost += self.graph.get_distance(a, b)
+        # BFS path cost = sum of road distances along path (recorded during the search)
+        cost = self._path_cost_ids(came_from, edge_cost, goal)
 
         return SearchResult(
             algorithm_name="BFS",
@@ -62,13 +75,3 @@ class BFS:
             runtime=runtime,
             is_optimal=False
         )
-
-    def _reconstruct_path(self, came_from: Dict[str, str], goal: str) -> list:
-        """Reconstruct the path from start to goal"""
-        path = []
-        current = goal
-        while current in came_from:
-            path.append(current)
-            current = came_from[current]
-        path.append(self.start)
-        return path[::-1]
\ No newline at end of file
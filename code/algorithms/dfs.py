@@ -1,33 +1,66 @@
-from collections import deque
-from typing import Dict, Set
+from typing import List
 from code.algorithms.base_algorithm import SearchAlgorithm
-from code.heartofitall.graph import Graph
 from code.heartofitall.search_results import SearchResult
 
 
 class DFS(SearchAlgorithm):
-    def helper(self, node: str, visited: Set[str], came_from: Dict[str, str]) -> bool:
-        if node == self.goal:
+    __slots__ = ()
+
+    def helper(self, start: int, goal: int, visited: List[bool], came_from: List[int],
+               edge_cost: List[float]) -> bool:
+        """
+        Depth-first walk from start over the CSR arrays using an explicit stack
+        instead of recursion. Visits neighbors in the same order the recursive
+        version did; fills came_from / edge_cost and returns True once goal is reached.
+        """
+        if start == goal:
             return True
-        visited.add(node)
-        self.nodes_expanded += 1
-        for neighbor, _dist in self.graph.get_neighbors(node).items():
-            if neighbor not in visited:
-                came_from[neighbor] = node
-                if self.helper(neighbor, visited, came_from):
-                    return True
+        ctx = self.ctx
+        indptr, indices, weights = ctx.indptr, ctx.indices, ctx.weights
+
+        visited[start] = True
+        nodes_expanded = self.nodes_expanded + 1  # local counter, written back before returning
+        # stack[i] is a node on the current branch, next_k[i] the next CSR slot to try
+        stack = [start]
+        next_k = [indptr[start]]
+        while stack:
+            node = stack[-1]
+            k = next_k[-1]
+            end = indptr[node + 1]
+            while k < end and visited[indices[k]]:
+                k += 1
+            if k == end:
+                stack.pop()
+                next_k.pop()
+                continue
+            next_k[-1] = k + 1
+
+            neighbor = indices[k]
+            came_from[neighbor] = node
+            edge_cost[neighbor] = weights[k]
+            if neighbor == goal:
+                self.nodes_expanded = nodes_expanded
+                return True
+            visited[neighbor] = True
+            nodes_expanded += 1
+            stack.append(neighbor)
+            next_k.append(indptr[neighbor])
+        self.nodes_expanded = nodes_expanded
         return False
 
     def search(self) -> SearchResult:
         self._start_timer()
-        came_from: Dict[str, str] = {}
-        visited: Set[str] = set()
-        self.helper(self.start, visited, came_from)
+        start, goal = self.ctx.start_id, self.ctx.goal_id
+        n = self.graph.num_nodes
+        came_from: List[int] = [-1] * n
+        visited: List[bool] = [False] * n
+        edge_cost: List[float] = [0.0] * n  # distance from came_from[i] to i
+        found = self.helper(start, goal, visited, came_from, edge_cost)
 
         runtime = self._stop_timer()
 
         # Check if goal was reached
-        if self.goal not in came_from and self.goal != self.start:
+        if not found:
             return SearchResult(
                 algorithm_name="DFS",
                 start=self.start,
@@ -40,12 +73,10 @@ class DFS(SearchAlgorithm):
             )
 
         # Reconstruct path
-        path = [self.start] if self.start == self.goal else self._reconstruct_path(came_from, self.goal)
+        path = self._reconstruct_path_ids(came_from, goal)
 
         # Calculate path cost
-        cost = 0.0
-        for a, b in zip(path, path[1:]):
-            cost += self.graph.get_distance(a, b)
+        cost = self._path_cost_ids(came_from, edge_cost, goal)
 
         return SearchResult(
             algorithm_name="DFS",
@@ -56,4 +87,4 @@ class DFS(SearchAlgorithm):
             nodes_expanded=self.nodes_expanded,
             runtime=runtime,
             is_optimal=False
-        )
\ No newline at end of file
+        )
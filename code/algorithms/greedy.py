@@ -1,62 +1,78 @@
+from heapq import heappush, heappop
 from code.algorithms.base_algorithm import SearchAlgorithm
 from code.heartofitall.search_results import SearchResult
-from code.heartofitall.priority_queue import PriorityQueue
-from code.utilities.heuristics import haversine_distance
 
 
 class GreedyBestFirst(SearchAlgorithm):
-
-    # Heuristic function
-    # Returns the estimated cost of reaching the goal from the current node
-    # h(n) = distance from n to goal
-    def _h(self, node: str) -> float:
-        lat1, lon1 = self.graph.get_coordinates(node)
-        lat2, lon2 = self.graph.get_coordinates(self.goal)
-        return haversine_distance(lat1, lon1, lat2, lon2)
+    __slots__ = ()
 
     def search(self) -> SearchResult:
         self._start_timer()
 
-        # Creates a priority queue ordered by heuristic values
-        frontier = PriorityQueue()
-        frontier.push(self.start, self._h(self.start))
-
-        came_from = {}
-        visited = {self.start}
-
-        while not frontier.is_empty():
-            current = frontier.pop()
-
-            if current == self.goal:
-                runtime = self._stop_timer()
-                path = self._reconstruct_path(came_from, current)
-                cost = sum(self.graph.get_distance(a, b) for a, b in zip(path, path[1:]))
-                return SearchResult(
-                    algorithm_name="Greedy",
-                    start=self.start,
-                    goal=self.goal,
-                    path=path,
-                    cost=cost,
-                    nodes_expanded=self.nodes_expanded,
-                    runtime=runtime,
-                    is_optimal=False
-                )
-
-            self.nodes_expanded += 1
-            for nbr, _ in self.graph.get_neighbors(current).items():
-                if nbr not in visited:
-                    visited.add(nbr)
+        # int node ids over the graph's CSR arrays, same layout as AStar
+        ctx = self.ctx
+        indptr, indices, weights = ctx.indptr, ctx.indices, ctx.weights
+        start, goal = ctx.start_id, ctx.goal_id
+        n = self.graph.num_nodes
+
+        # Heuristic function
+        # h[i] = estimated cost of reaching the goal from node i (distance from i to goal)
+        h = ctx.h_to_goal
+
+        # Creates a heap ordered by heuristic values: (h, push order, node)
+        frontier = [(h[start], 0, start)]
+        pushed = 1
+
+        came_from = [-1] * n
+        edge_cost = [0.0] * n  # distance from came_from[i] to i, for the path cost
+        visited = [False] * n
+        visited[start] = True
+        nodes_expanded = self.nodes_expanded  # local counter, written back before returning
+
+        # goal test when a node is generated: the goal has h = 0, so once pushed
+        # it would be the very next pop anyway; stop without the heap round trip
+        found = start == goal
+        while frontier and not found:
+            _, _, current = heappop(frontier)
+
+            nodes_expanded += 1
+            for k in range(indptr[current], indptr[current + 1]):
+                nbr = indices[k]
+                if not visited[nbr]:
+                    visited[nbr] = True
                     came_from[nbr] = current
-                    frontier.push(nbr, self._h(nbr))
+                    edge_cost[nbr] = weights[k]
+                    if nbr == goal:
+                        found = True
+                        break
+                    heappush(frontier, (h[nbr], pushed, nbr))
+                    pushed += 1
+
+        if found:
+            runtime = self._stop_timer()
+            self.nodes_expanded = nodes_expanded
+            path = self._reconstruct_path_ids(came_from, goal)
+            cost = self._path_cost_ids(came_from, edge_cost, goal)
+            return SearchResult(
+                algorithm_name="Greedy",
+                start=self.start,
+                goal=self.goal,
+                path=path,
+                cost=cost,
+                nodes_expanded=nodes_expanded,
+                runtime=runtime,
+                is_optimal=False
+            )
 
         runtime = self._stop_timer()
+        self.nodes_expanded = nodes_expanded
         return SearchResult(
             algorithm_name="Greedy",
             start=self.start,
             goal=self.goal,
             path=[],
             cost=float("inf"),
-            nodes_expanded=self.nodes_expanded,
+            nodes_expanded=nodes_expanded,
             runtime=runtime,
             is_optimal=False
         )
\ No newline at end of file
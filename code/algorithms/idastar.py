@@ -1,23 +1,20 @@
 from math import inf
 from code.algorithms.base_algorithm import SearchAlgorithm
 from code.heartofitall.search_results import SearchResult
-from code.utilities.heuristics import haversine_distance
 
 
 class IDAStar(SearchAlgorithm):
-
-    def _h(self, node: str) -> float:
-        """Heuristic: haversine distance from node to goal."""
-        lat1, lon1 = self.graph.get_coordinates(node)
-        lat2, lon2 = self.graph.get_coordinates(self.goal)
-        return haversine_distance(lat1, lon1, lat2, lon2)
+    __slots__ = ()
 
     def search(self) -> SearchResult:
         self._start_timer()
 
-        threshold = self._h(self.start)
+        # the goal is fixed, so h for every node comes from the shared ctx table
+        # nodes are int ids over the graph's CSR arrays
+        start = self.ctx.start_id
+        threshold = self.ctx.h_to_goal[start]
 
-        path = [self.start]
+        path = [start]
         g_costs = [0.0]
 
         while True:
@@ -54,40 +51,71 @@ class IDAStar(SearchAlgorithm):
 
     def _bounded_search(self, path: list, g_costs: list, threshold: float):
         """
-        Recursive depth-first search bounded by f-cost threshold.
+        Depth-first search bounded by f-cost threshold, run with an explicit
+        stack instead of recursion. path / g_costs hold the current branch
+        (node ids and their g) and start out as [start] / [0.0].
 
         Returns:
-            - The path (list) if goal is found
+            - The path (list of city names) if goal is found
             - inf if no solution exists
             - The minimum f-cost exceeding threshold (for next iteration)
         """
+        ctx = self.ctx
+        indptr, indices, weights = ctx.indptr, ctx.indices, ctx.weights
+        h = ctx.h_to_goal
+        goal = ctx.goal_id
+
         node = path[-1]
-        g = g_costs[-1]
-        f = g + self._h(node)
+        f = g_costs[-1] + h[node]
 
         if f > threshold:
             return f
 
-        if node == self.goal:
-            return list(path)
-
-        self.nodes_expanded += 1
-        min_exceeded = inf
-
-        for neighbor, edge_cost in self.graph.get_neighbors(node).items():
-            if neighbor not in path:
-                path.append(neighbor)
-                g_costs.append(g + edge_cost)
+        if node == goal:
+            return [self.graph.get_node_name(i) for i in path]
 
-                result = self._bounded_search(path, g_costs, threshold)
+        nodes_expanded = self.nodes_expanded + 1  # local counter, written back before returning
+        # per node on the branch: next CSR slot to try, smallest f seen above threshold
+        next_k = [indptr[node]]
+        min_exceeded = [inf]
+        on_path = [False] * self.graph.num_nodes  # O(1) loop check instead of scanning path
+        for i in path:
+            on_path[i] = True
 
-                if isinstance(result, list):
+        while True:
+            node = path[-1]
+            k = next_k[-1]
+            if k == indptr[node + 1]:
+                # node is exhausted: hand its minimum back to the parent
+                result = min_exceeded.pop()
+                next_k.pop()
+                if not next_k:
+                    self.nodes_expanded = nodes_expanded
                     return result
-
-                if result < min_exceeded:
-                    min_exceeded = result
-
-                path.pop()
+                on_path[path.pop()] = False
                 g_costs.pop()
-
-        return min_exceeded
\ No newline at end of file
+                if result < min_exceeded[-1]:
+                    min_exceeded[-1] = result
+                continue
+            next_k[-1] = k + 1
+
+            neighbor = indices[k]
+            if on_path[neighbor]:
+                continue
+            g = g_costs[-1] + weights[k]
+            f = g + h[neighbor]
+            if f > threshold:
+                if f < min_exceeded[-1]:
+                    min_exceeded[-1] = f
+                continue
+
+            path.append(neighbor)
+            g_costs.append(g)
+            if neighbor == goal:
+                self.nodes_expanded = nodes_expanded
+                return [self.graph.get_node_name(i) for i in path]
+
+            nodes_expanded += 1
+            on_path[neighbor] = True
+            next_k.append(indptr[neighbor])
+            min_exceeded.append(inf)
@@ -1,37 +1,29 @@
+from code.algorithms.base_algorithm import SearchAlgorithm
 from code.heartofitall.search_results import SearchResult
-import time
 
-class IDS:
-    def __init__(self, graph, start, goal):
-        self.graph = graph
-        self.start = start
-        self.goal = goal
-        self.nodes_expanded = 0
+class IDS(SearchAlgorithm):
+    __slots__ = ()
 
     def search(self)-> SearchResult:
         depth = 0
-        start_time = time.time()
+        self._start_timer()
         result = None
+        start, goal = self.ctx.start_id, self.ctx.goal_id
         while True:
-            #print(depth)
-            result = self.depth_limited_search(self.start, depth, [self.start])
+            result = self.depth_limited_search(start, goal, depth)
             if result is not None or depth>50:
                 break
             depth+=1
 
-        #print(result)
-
-        run_time = time.time()-start_time
-        cost = 0.0
-        for a, b in zip(result, result[1:]):
-            cost += self.graph.get_distance(a, b)
+        run_time = self._stop_timer()
 
         if result:
+            path, cost = result
             return SearchResult(
                 algorithm_name="IDS",
                 start=self.start,
                 goal=self.goal,
-                path=result,
+                path=path,
                 cost=cost,
                 nodes_expanded=self.nodes_expanded,
                 runtime=run_time,
@@ -50,16 +42,50 @@ class IDS:
             )
 
 
-    def depth_limited_search(self, node, depth, path):
-        if node == self.goal:
-            return [node]
-        if depth == 0:
+    def depth_limited_search(self, start, goal, limit):
+        """
+        Depth-limited DFS from start with an explicit stack over the CSR arrays.
+        The stack doubles as the current path; returns (path as city names, cost)
+        when goal is reached within limit edges, otherwise None.
+        """
+        if start == goal:
+            return [self.graph.get_node_name(start)], 0.0
+        if limit == 0:
             return None
-        #print([node])
-        self.nodes_expanded+=1
-        for neighbor, dist in self.graph.get_neighbors(node).items():
-            if neighbor not in path:
-                result = self.depth_limited_search(neighbor, depth - 1, path+[neighbor])
-                if result is not None:
-                    return [node] + result
+        ctx = self.ctx
+        indptr, indices, weights = ctx.indptr, ctx.indices, ctx.weights
+
+        nodes_expanded = self.nodes_expanded + 1  # local counter, written back before returning
+        path = [start]
+        next_k = [indptr[start]]  # next CSR slot to try for each node on the path
+        on_path = [False] * self.graph.num_nodes  # O(1) membership instead of scanning path
+        on_path[start] = True
+        while path:
+            node = path[-1]
+            k = next_k[-1]
+            if k == indptr[node + 1]:
+                on_path[path.pop()] = False
+                next_k.pop()
+                continue
+            next_k[-1] = k + 1
+
+            neighbor = indices[k]
+            if on_path[neighbor]:
+                continue
+            if neighbor == goal:
+                self.nodes_expanded = nodes_expanded
+                # next_k[i] - 1 is the CSR slot of the edge path[i] -> path[i + 1]
+                cost = 0.0
+                for slot in next_k:
+                    cost += weights[slot - 1]
+                path.append(neighbor)
+                return [self.graph.get_node_name(i) for i in path], cost
+            # neighbor would sit at depth len(path); at the limit it is not expanded
+            if len(path) == limit:
+                continue
+            nodes_expanded+=1
+            path.append(neighbor)
+            on_path[neighbor] = True
+            next_k.append(indptr[neighbor])
+        self.nodes_expanded = nodes_expanded
         return None
@@ -1,60 +1,81 @@
-from typing import Dict
+from heapq import heappush, heappop
+from typing import List
 from math import inf
 from code.algorithms.base_algorithm import SearchAlgorithm
 from code.heartofitall.search_results import SearchResult
-from code.heartofitall.priority_queue import PriorityQueue
 
 class UCS(SearchAlgorithm):
+    __slots__ = ()
 
     def search(self) -> SearchResult:
         self._start_timer()
 
         # Initialization
-        frontier = PriorityQueue()  # priority queue that orders nodes by their path cost
-        frontier.push(self.start, 0.0)
+        # nodes are int ids over the graph's CSR arrays (see Graph.get_csr)
+        ctx = self.ctx
+        indptr, indices, weights = ctx.indptr, ctx.indices, ctx.weights
+        start, goal = ctx.start_id, ctx.goal_id
+        n = self.graph.num_nodes
 
-        came_from: Dict[str, str] = {}  # tracks the parent of each node to reconstruct the path later
-        cost_so_far: Dict[str, float] = {self.start: 0.0}  # stores the cheapest known cost to reach each node
+        frontier = [(0.0, 0, start)]  # heap of (path cost, push order, node); push order keeps ties FIFO
+        pushed = 1
 
-        while not frontier.is_empty():
-            current = frontier.pop()
-            current_cost = cost_so_far[current]
+        came_from: List[int] = [-1] * n  # tracks the parent of each node to reconstruct the path later
+        cost_so_far: List[float] = [inf] * n  # stores the cheapest known cost to reach each node
+        cost_so_far[start] = 0.0
+        closed: List[bool] = [False] * n  # expanded nodes; their cost_so_far is final
+        nodes_expanded = self.nodes_expanded  # local counter, written back before returning
+
+        while frontier:
+            current_cost, _, current = heappop(frontier)
+
+            # Lazy deletion: skip entries that were superseded by a cheaper push
+            # or whose node was already expanded
+            if closed[current] or current_cost > cost_so_far[current]:
+                continue
+            closed[current] = True
 
             # Goal test when a node is selected for expansion (not when discovered)
-            if current == self.goal:
+            if current == goal:
                 runtime = self._stop_timer()
-                path = self._reconstruct_path(came_from, current)
+                self.nodes_expanded = nodes_expanded
+                path = self._reconstruct_path_ids(came_from, current)
                 return SearchResult(
                     algorithm_name="UCS",
                     start=self.start,
                     goal=self.goal,
                     path=path,
                     cost=current_cost,
-                    nodes_expanded=self.nodes_expanded,
+                    nodes_expanded=nodes_expanded,
                     runtime=runtime,
                     is_optimal=True  # Non-negative road distances => optimal
                 )
 
             # Expand current node
             # Pops the lowest-cost node and checks neighbors
-            self.nodes_expanded += 1
-            for neighbor, edge_dist in self.graph.get_neighbors(current).items():
-                new_cost = current_cost + edge_dist
+            nodes_expanded += 1
+            for k in range(indptr[current], indptr[current + 1]):
+                neighbor = indices[k]
+                if closed[neighbor]:
+                    continue  # can't be improved with non-negative distances
+                new_cost = current_cost + weights[k]
                 # Only improve if strictly better path found
-                if new_cost < cost_so_far.get(neighbor, inf):
+                if new_cost < cost_so_far[neighbor]:
                     cost_so_far[neighbor] = new_cost
                     came_from[neighbor] = current
-                    frontier.push(neighbor, new_cost)
+                    heappush(frontier, (new_cost, pushed, neighbor))
+                    pushed += 1
 
         # If we exhaust the frontier, goal is unreachable
         runtime = self._stop_timer()
+        self.nodes_expanded = nodes_expanded
         return SearchResult(
             algorithm_name="UCS",
             start=self.start,
             goal=self.goal,
             path=[],
             cost=inf,
-            nodes_expanded=self.nodes_expanded,
+            nodes_expanded=nodes_expanded,
             runtime=runtime,
             is_optimal=False
         )
\ No newline at end of file
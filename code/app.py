@@ -1,10 +1,23 @@
 import sys
 
-from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtCore import QSize, Qt, QThread, pyqtSignal
 from PyQt6.QtWidgets import QApplication, QMainWindow, QPushButton, QComboBox, QVBoxLayout, QWidget, QLabel, QTextEdit
 from main import run_compare
 
 
+class CompareWorker(QThread):
+    """Runs run_compare off the GUI thread so the window stays responsive"""
+    routes = pyqtSignal(object)  # tuple of result strings
+
+    def __init__(self, start_city, goal_city):
+        super().__init__()
+        self.start_city = start_city
+        self.goal_city = goal_city
+
+    def run(self):
+        self.routes.emit(run_compare(self.start_city, self.goal_city))
+
+
 # Subclass QMainWindow to customize your application's main window
 class MainWindow(QMainWindow):
     def __init__(self):
@@ -21,10 +34,10 @@ class MainWindow(QMainWindow):
         self.combobox.addItems(['Buffalo', 'Syracuse', 'Albany', 'New York City'])
         layout.addWidget(self.combobox)
 
-        button = QPushButton("Find Routes")
-        button.setCheckable(True)
-        button.clicked.connect(self.the_button_was_clicked)
-        layout.addWidget(button)
+        self.button = QPushButton("Find Routes")
+        self.button.setCheckable(True)
+        self.button.clicked.connect(self.the_button_was_clicked)
+        layout.addWidget(self.button)
 
         self.output = QTextEdit("")
         self.output.setReadOnly(True)
@@ -41,14 +54,18 @@ class MainWindow(QMainWindow):
         # self.setCentralWidget(button)
 
     def the_button_was_clicked(self):
-        print("Clicked!")
         self.output.setText(f"Finding routes from Rochester to {self.combobox.currentText()}...")
-        routes = run_compare("Rochester", self.combobox.currentText())
-        # self.output.setText(f"Finding routes from Rochester to {self.combobox.currentText()}...")
-        self.output.setText(f"Routes found: ")
-        for route in routes:
-            self.output.append(route)
-        ##self.output.append("".join(routes))
+        # searches run in a worker thread; show_routes gets the results via a signal
+        self.button.setEnabled(False)
+        self.worker = CompareWorker("Rochester", self.combobox.currentText())
+        self.worker.routes.connect(self.show_routes)
+        self.worker.start()
+
+    def show_routes(self, routes):
+        # one setPlainText instead of an append (and relayout) per route
+        self.output.setPlainText("\n".join(["Routes found: ", *routes]))
+        self.button.setChecked(False)
+        self.button.setEnabled(True)
 
 
 app = QApplication(sys.argv)
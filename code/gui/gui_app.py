@@ -6,6 +6,7 @@ A comprehensive PyQt6 interface for the route planning system
 import sys
 from pathlib import Path
 import json
+from collections import OrderedDict, deque
 from typing import Optional, List, Dict
 from datetime import datetime
 
@@ -20,77 +21,310 @@ from PyQt6.QtWidgets import (
     QTableWidget, QTableWidgetItem, QHeaderView, QSplitter,
     QTabWidget, QCheckBox, QSpinBox, QSlider, QProgressBar,
     QMenuBar, QMenu, QFileDialog, QMessageBox,
-    QToolBar, QStatusBar, QGridLayout, QListWidget,
-    QRadioButton, QButtonGroup, QFrame
+    QToolBar, QStatusBar, QGridLayout, QListView,
+    QRadioButton, QButtonGroup, QFrame, QSizePolicy
 )
-from PyQt6.QtCore import Qt, QThread, pyqtSignal, QTimer, QSize
-from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QPixmap, QAction
+from PyQt6.QtCore import Qt, QThread, QThreadPool, QRunnable, QObject, QStringListModel, pyqtSignal, QTimer, QSize
+from PyQt6.QtGui import QFont, QPalette, QColor, QIcon, QImage, QPixmap, QAction
 
 from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
 from matplotlib.backends.backend_qtagg import NavigationToolbar2QT as NavigationToolbar
-import matplotlib.pyplot as plt
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.colors import to_rgba
+from matplotlib import rcParams
+import numpy as np
 
 # Import project modules
 try:
     # Try package-style imports first (when run from project root)
-    from code.utilities.data_loader import load_graph, get_graph_statistics
-    from code.utilities.route_planner import RoutePlanner
+    from code.utilities.data_loader import (
+        load_graph, get_graph_statistics, default_cache_file,
+        default_result_cache_file, load_result_cache, save_result_cache
+    )
+    from code.utilities.route_planner import RoutePlanner, ComparisonResult, normalize_algorithm_name
+    from code.algorithms.base_algorithm import prepare_search_context
     from code.utilities.visualizer import GraphVisualizer
     from code.heartofitall.graph import Graph
+    from code.heartofitall.search_results import SearchResult
 except ModuleNotFoundError:
     # Fall back to relative imports (when run directly from gui folder)
     sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
-    from code.utilities.data_loader import load_graph, get_graph_statistics
-    from code.utilities.route_planner import RoutePlanner
+    from code.utilities.data_loader import (
+        load_graph, get_graph_statistics, default_cache_file,
+        default_result_cache_file, load_result_cache, save_result_cache
+    )
+    from code.utilities.route_planner import RoutePlanner, ComparisonResult, normalize_algorithm_name
+    from code.algorithms.base_algorithm import prepare_search_context
     from code.utilities.visualizer import GraphVisualizer
     from code.heartofitall.graph import Graph
+    from code.heartofitall.search_results import SearchResult
+
+
+# Style sheets, built once at import instead of on every window
+MAIN_STYLESHEET = """
+    QMainWindow {
+        background-color: #f5f5f5;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #cccccc;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+    }
+    QPushButton {
+        background-color: #4CAF50;
+        color: white;
+        border: none;
+        padding: 8px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #45a049;
+    }
+    QPushButton:pressed {
+        background-color: #3d8b40;
+    }
+    QComboBox {
+        padding: 5px;
+        border: 1px solid #cccccc;
+        border-radius: 4px;
+    }
+"""
+
+# red variant of the QPushButton style, for the Clear button
+DANGER_BUTTON_STYLESHEET = """
+    QPushButton {
+        background-color: #f44336;
+    }
+    QPushButton:hover {
+        background-color: #da190b;
+    }
+"""
 
 
-class AlgorithmWorker(QThread):
-    """Worker thread for running algorithms without blocking GUI"""
-    progress = pyqtSignal(str)  # Algorithm name
+class WorkerSignals(QObject):
+    """Signals for AlgoRunnable (a QRunnable isn't a QObject, so it can't own signals)"""
     result = pyqtSignal(object)  # SearchResult
-    finished = pyqtSignal()
     error = pyqtSignal(str)
 
-    def __init__(self, route_planner, algorithm, start_city, goal_city):
+
+class AlgoRunnable(QRunnable):
+    """One algorithm search (a single search, or one algorithm of a comparison), run on a QThreadPool"""
+
+    def __init__(self, route_planner, algorithm, start_city, goal_city, ctx=None, in_process=False):
         super().__init__()
+        self.setAutoDelete(False)  # RouteFinderGUI holds it until its result is in
         self.route_planner = route_planner
         self.algorithm = algorithm
-        self.start_city = start_city  # Changed from self.start to avoid collision with QThread.start()!
-        self.goal_city = goal_city    # Changed from self.goal for consistency
+        self.start_city = start_city
+        self.goal_city = goal_city
+        self.ctx = ctx
+        # search in one of the planner's worker processes and wait for it here,
+        # so parallel comparisons aren't serialized on the GIL
+        self.in_process = in_process
+        self.signals = WorkerSignals()
 
     def run(self):
         try:
-            self.progress.emit(f"Running {self.algorithm}...")
-            result = self.route_planner.run_single_algorithm(
-                self.algorithm, self.start_city, self.goal_city
-            )
-            self.result.emit(result)
+            if self.in_process:
+                result = self.route_planner.submit_single_algorithm(
+                    self.algorithm, self.start_city, self.goal_city
+                ).result()
+            else:
+                result = self.route_planner.run_single_algorithm(
+                    self.algorithm, self.start_city, self.goal_city, self.ctx
+                )
+            self.signals.result.emit(result)
         except Exception as e:
             import traceback
             error_msg = f"Error in {self.algorithm}: {str(e)}\n{traceback.format_exc()}"
-            self.error.emit(error_msg)
-        finally:
-            self.finished.emit()
+            self.signals.error.emit(error_msg)
+
+
+class RenderWorker(QThread):
+    """Worker thread that renders the full road network offscreen (Agg)"""
+    rendered = pyqtSignal(object, object, object)  # cache key, RGBA array, (xmin, xmax, ymin, ymax)
+    error = pyqtSignal(str)
+
+    def __init__(self, visualizer, key, show_weights, size_inches, dpi):
+        super().__init__()
+        self.visualizer = visualizer
+        self.key = key
+        self.show_weights = show_weights
+        self.size_inches = size_inches
+        self.dpi = dpi
+
+    def run(self):
+        try:
+            # private Figure + Agg canvas, nothing here touches the Qt canvas or pyplot
+            fig = Figure(figsize=self.size_inches, dpi=self.dpi)
+            fig.patch.set_alpha(0.0)  # transparent, so the GUI axes' facecolor shows through
+            canvas = FigureCanvasAgg(fig)
+            ax = fig.add_axes([0, 0, 1, 1])
+            self.visualizer.draw_graph(ax=ax, show_weights=self.show_weights, title="")
+            ax.set_axis_off()
+            canvas.draw()
+
+            # crop to the axes box (the equal aspect ratio shrinks it inside the figure)
+            full = np.asarray(canvas.buffer_rgba())
+            box = ax.get_window_extent()
+            height = full.shape[0]
+            rows = slice(max(height - int(round(box.y1)), 0), height - int(round(box.y0)))
+            cols = slice(max(int(round(box.x0)), 0), int(round(box.x1)))
+            rgba = full[rows, cols].copy()
+
+            xmin, xmax = ax.get_xlim()
+            ymin, ymax = ax.get_ylim()
+            self.rendered.emit(self.key, rgba, (xmin, xmax, ymin, ymax))
+        except Exception as e:
+            import traceback
+            self.error.emit(f"Error rendering graph: {str(e)}\n{traceback.format_exc()}")
+
+
+def draw_comparison_charts(fig, comparison):
+    """Bar charts of cost, nodes expanded and runtime for a ComparisonResult, drawn into fig"""
+    results = comparison.results
+    names = [r.algorithm_name for r in results]
+    colors = ['green' if r.is_optimal else 'orange' for r in results]
+    charts = [
+        ('Path Cost (miles)', 'Distance (miles)', [r.cost for r in results]),
+        ('Nodes Expanded', 'Number of Nodes', [r.nodes_expanded for r in results]),
+        ('Runtime (milliseconds)', 'Time (ms)', [r.runtime * 1000 for r in results]),
+    ]
+
+    for i, (title, ylabel, values) in enumerate(charts):
+        ax = fig.add_subplot(1, 3, i + 1)
+        ax.bar(range(len(values)), values, color=colors)
+        ax.set_title(title)
+        ax.set_ylabel(ylabel)
+        # one tick per bar, labelled with its algorithm
+        ax.set_xticks(range(len(results)))
+        ax.set_xticklabels(names)
+        ax.grid(True, alpha=0.3)
+
+    fig.suptitle(
+        f'Algorithm Comparison: {comparison.start} to {comparison.goal}',
+        fontsize=14,
+        fontweight='bold'
+    )
+    fig.tight_layout(rect=[0, 0, 1, 0.96])
+
+
+class ChartWorker(QThread):
+    """Worker thread that renders the comparison charts offscreen (Agg)"""
+    rendered = pyqtSignal(object, object)  # key, RGBA array
+    error = pyqtSignal(str)
+
+    def __init__(self, key, comparison, size_inches, dpi):
+        super().__init__()
+        self.key = key
+        self.comparison = comparison
+        self.size_inches = size_inches
+        self.dpi = dpi
+
+    def run(self):
+        try:
+            # private Figure + Agg canvas, like RenderWorker
+            fig = Figure(figsize=self.size_inches, dpi=self.dpi)
+            canvas = FigureCanvasAgg(fig)
+            draw_comparison_charts(fig, self.comparison)
+            canvas.draw()
+            rgba = np.asarray(canvas.buffer_rgba()).copy()
+            self.rendered.emit(self.key, rgba)
+        except Exception as e:
+            import traceback
+            self.error.emit(f"Error rendering comparison charts: {str(e)}\n{traceback.format_exc()}")
+
+
+class ChartLabel(QLabel):
+    """QLabel showing a rendered chart; says when it's resized so the chart can be redone at the new size"""
+    resized = pyqtSignal()
+
+    # sized like the FigureCanvas it replaces (a 12 x 5 in figure at 100 dpi) rather
+    # than by its pixmap, which would keep the layout from ever shrinking it
+    def sizeHint(self):
+        return QSize(1200, 500)
+
+    def minimumSizeHint(self):
+        return QSize(10, 10)
+
+    def resizeEvent(self, event):
+        super().resizeEvent(event)
+        self.resized.emit()
 
 
 class RouteFinderGUI(QMainWindow):
     """Main GUI Application for NY Route Planner"""
 
+    # most (algorithm, start, goal) results kept in result_cache
+    RESULT_CACHE_SIZE = 512
+    # most recent searches kept in current_results and the results panel
+    RESULT_HISTORY = 50
+    RESULT_TEXT_LINES = 10  # lines display_result writes per search
+    _project_root = None  # see find_project_root
+    # "Optimal" cell backgrounds of the comparison table
+    OPTIMAL_BG = QColor(200, 255, 200)
+    NON_OPTIMAL_BG = QColor(255, 200, 200)
+
     def __init__(self):
         super().__init__()
         self.graph = None
         self.route_planner = None
         self.visualizer = None
-        self.current_results = []
+        self.current_results = deque(maxlen=self.RESULT_HISTORY)
         self.comparison_result = None
+        # (algorithm, start, goal) -> SearchResult, least recently used first;
+        # shared by both tabs, the graph doesn't change after load_data.
+        # Saved next to the CSVs on close and reloaded by load_data
+        self.result_cache = OrderedDict()
+        self.data_files = None  # (cities_csv, edges_csv) of the loaded graph
+        # get_graph_statistics of self.graph, computed on first use after load_data
+        self.graph_stats = None
 
         # Animation state
         self.animation_timer = None
         self.animation_step = 0
         self.animation_result = None
 
+        # Offscreen renders of the full network, keyed by show_weights
+        self.network_images = {}
+        self.render_worker = None
+        # the image currently on the graph axes, reused across redraws
+        self.network_image_artist = None
+        self.network_image_key = None
+        # what draw_static_result last put on the canvas, see there
+        self.last_drawn_view = None
+        # canvas pixels without the overlays, saved by graph_canvas_drawn
+        self.graph_background = None
+
+        # Single searches: one AlgoRunnable at a time on a pool whose thread is kept
+        # alive between clicks, instead of a new QThread per search
+        self.search_pool = QThreadPool(self)
+        self.search_pool.setMaxThreadCount(1)
+        self.search_pool.setExpiryTimeout(-1)
+        self.search_runnable = None
+
+        # Comparison runs: one AlgoRunnable per algorithm on this pool
+        self.comparison_pool = QThreadPool(self)
+        self.comparison_request = None
+        self.comparison_results = []
+        self.comparison_errors = []
+        self.comparison_runnables = []
+        self.comparison_remaining = 0
+        # (row, col) -> QTableWidgetItem of the comparison table, see comparison_cell
+        self.comparison_cells = {}
+        # charts of comparison_result, rendered off the GUI thread by a ChartWorker
+        self.chart_worker = None
+        self.chart_rendered_for = None  # (comparison, pixel size) of the pixmap on comparison_chart
+
         self.initUI()
         self.load_data()
 
@@ -100,42 +334,7 @@ class RouteFinderGUI(QMainWindow):
         self.setGeometry(100, 100, 1400, 900)
 
         # Set application style
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #f5f5f5;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #cccccc;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-            }
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border: none;
-                padding: 8px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-            QPushButton:pressed {
-                background-color: #3d8b40;
-            }
-            QComboBox {
-                padding: 5px;
-                border: 1px solid #cccccc;
-                border-radius: 4px;
-            }
-        """)
+        self.setStyleSheet(MAIN_STYLESHEET)
 
         # Create menu bar
         self.create_menu_bar()
@@ -213,9 +412,10 @@ class RouteFinderGUI(QMainWindow):
         self.addToolBar(toolbar)
 
         # Run button
-        run_action = QAction('Run Search', self)
-        run_action.triggered.connect(self.run_single_search)
-        toolbar.addAction(run_action)
+        # kept so it can be disabled with run_button while a search is running
+        self.run_action = QAction('Run Search', self)
+        self.run_action.triggered.connect(self.run_single_search)
+        toolbar.addAction(self.run_action)
 
         toolbar.addSeparator()
 
@@ -285,7 +485,9 @@ class RouteFinderGUI(QMainWindow):
             "A* Search",
             "IDA* Search",
         ]
-        self.algo_combo.addItems(display_names)
+        # each item carries its algorithm key, so run_single_search doesn't parse the label
+        for label in display_names:
+            self.algo_combo.addItem(label, self.algorithm_key(label))
 
         algo_layout.addWidget(self.algo_combo)
 
@@ -331,14 +533,7 @@ class RouteFinderGUI(QMainWindow):
 
         self.clear_button = QPushButton("Clear")
         self.clear_button.clicked.connect(self.clear_results)
-        self.clear_button.setStyleSheet("""
-            QPushButton {
-                background-color: #f44336;
-            }
-            QPushButton:hover {
-                background-color: #da190b;
-            }
-        """)
+        self.clear_button.setStyleSheet(DANGER_BUTTON_STYLESHEET)
         button_layout.addWidget(self.clear_button)
 
         left_layout.addLayout(button_layout)
@@ -349,6 +544,8 @@ class RouteFinderGUI(QMainWindow):
 
         self.results_text = QTextEdit()
         self.results_text.setReadOnly(True)
+        # rolling history: the oldest lines are dropped once RESULT_HISTORY searches are shown
+        self.results_text.document().setMaximumBlockCount(self.RESULT_HISTORY * self.RESULT_TEXT_LINES)
         results_layout.addWidget(self.results_text)
 
         results_group.setLayout(results_layout)
@@ -361,8 +558,9 @@ class RouteFinderGUI(QMainWindow):
         right_layout = QVBoxLayout(right_panel)
 
         # Graph visualization
-        self.graph_figure = plt.figure(figsize=(10, 8))
+        self.graph_figure = Figure(figsize=(10, 8))
         self.graph_canvas = FigureCanvas(self.graph_figure)
+        self.graph_canvas.mpl_connect('draw_event', self.graph_canvas_drawn)
         self.graph_toolbar = NavigationToolbar(self.graph_canvas, self)
 
         right_layout.addWidget(self.graph_toolbar)
@@ -442,9 +640,18 @@ class RouteFinderGUI(QMainWindow):
         chart_layout = QVBoxLayout(chart_widget)
         chart_layout.addWidget(QLabel("Performance Metrics:"))
 
-        self.comparison_figure = plt.figure(figsize=(12, 5))
-        self.comparison_canvas = FigureCanvas(self.comparison_figure)
-        chart_layout.addWidget(self.comparison_canvas)
+        # a static image: the charts are rendered by a ChartWorker, so building and
+        # laying out the three subplots doesn't hold up the GUI thread
+        self.comparison_chart = ChartLabel()
+        self.comparison_chart.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.comparison_chart.setSizePolicy(QSizePolicy.Policy.Expanding, QSizePolicy.Policy.Expanding)
+        # re-render once the user has finished resizing, not on every step
+        self.chart_resize_timer = QTimer(self)
+        self.chart_resize_timer.setSingleShot(True)
+        self.chart_resize_timer.setInterval(150)
+        self.chart_resize_timer.timeout.connect(self.render_comparison_chart)
+        self.comparison_chart.resized.connect(self.chart_resize_timer.start)
+        chart_layout.addWidget(self.comparison_chart)
 
         splitter.addWidget(chart_widget)
 
@@ -488,7 +695,12 @@ class RouteFinderGUI(QMainWindow):
         connections_group = QGroupBox("City Connections")
         connections_layout = QVBoxLayout()
 
-        self.city_list = QListWidget()
+        # read-only view over one string model, refilled by load_data
+        self.city_list_model = QStringListModel(self)
+        self.city_list = QListView()
+        self.city_list.setModel(self.city_list_model)
+        self.city_list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
+        self.city_list.setUniformItemSizes(True)
         connections_layout.addWidget(self.city_list)
 
         connections_group.setLayout(connections_layout)
@@ -586,34 +798,49 @@ class RouteFinderGUI(QMainWindow):
 
         return tab
 
+    @classmethod
+    def find_project_root(cls):
+        """
+        Nearest ancestor of this file with data/cities.csv and data/edges.csv.
+        A found root is kept for the session, so reloads skip the walk.
+        """
+        if cls._project_root is not None:
+            return cls._project_root
+        here = Path(__file__).resolve()
+        for up in [here, *here.parents]:
+            if (up / "data" / "cities.csv").is_file() and (up / "data" / "edges.csv").is_file():
+                cls._project_root = up
+                return up
+        return here.parents[1]
+
     def load_data(self):
         """Load graph data and initialize components"""
         try:
             # Locate CSVs
-            here = Path(__file__).resolve()
-            project_root = None
-            for up in [here, *here.parents]:
-                if (up / "data" / "cities.csv").exists() and (up / "data" / "edges.csv").exists():
-                    project_root = up
-                    break
-            if project_root is None:
-                project_root = here.parents[1]
+            project_root = self.find_project_root()
 
             cities_csv = project_root / "data" / "cities.csv"
             edges_csv = project_root / "data" / "edges.csv"
 
             # Load graph
-            self.graph = load_graph(cities_csv, edges_csv)
+            # Load graph (pickled snapshot next to the CSVs, reparsed when they change)
+            self.graph = load_graph(cities_csv, edges_csv, cache_file=default_cache_file(cities_csv))
 
             # Planner + visualizer
             self.route_planner = RoutePlanner(self.graph)
             self.visualizer = GraphVisualizer(self.graph, self.graph_figure)
-
-            # Populate city combos
-            cities = sorted(self.graph.get_all_cities())
+            self.network_images = {}
+            self.last_drawn_view = None
+            self.data_files = (cities_csv, edges_csv)
+            saved = load_result_cache(default_result_cache_file(cities_csv), cities_csv, edges_csv)
+            self.result_cache = OrderedDict(list(saved.items())[-self.RESULT_CACHE_SIZE:])
+            self.graph_stats = None
+
+            # Populate city combos (one shared model instead of four copies of the list)
+            cities = self.graph.get_sorted_cities()
+            self.city_model = QStringListModel(cities, self)
             for cb in (self.start_combo, self.goal_combo, self.comp_start_combo, self.comp_goal_combo):
-                cb.clear()
-                cb.addItems(cities)
+                cb.setModel(self.city_model)
 
             # Sensible defaults
             if "Rochester" in cities:
@@ -627,10 +854,9 @@ class RouteFinderGUI(QMainWindow):
             self.update_statistics()
 
             # City list with connection counts
-            self.city_list.clear()
-            for city in cities:
-                connections = len(self.graph.get_neighbors(city))
-                self.city_list.addItem(f"{city} ({connections} connections)")
+            self.city_list_model.setStringList([
+                f"{city} ({len(self.graph.get_neighbors(city))} connections)" for city in cities
+            ])
 
             # Draw the graph
             self.refresh_graph()
@@ -640,8 +866,22 @@ class RouteFinderGUI(QMainWindow):
             QMessageBox.critical(self, "Error", f"Failed to load data: {e}")
             self.statusBar.showMessage("Failed to load data")
 
+    def algorithm_key(self, algo_label):
+        """Convert a dropdown display name to the short algorithm key, with robust fallback"""
+        algorithm = self._ALGO_LABEL_TO_KEY.get(algo_label)
+        if algorithm is None:
+            # Fallback: extract short name from "NAME (Description)" format
+            if "(" in algo_label:
+                algorithm = algo_label.split("(")[0].strip()
+            else:
+                algorithm = algo_label.split()[0]
+        return algorithm
+
     def run_single_search(self):
         """Run a single algorithm search"""
+        if self.search_runnable is not None:
+            return  # the previous search is still running
+
         start = self.start_combo.currentText()
         goal = self.goal_combo.currentText()
 
@@ -649,43 +889,99 @@ class RouteFinderGUI(QMainWindow):
             QMessageBox.warning(self, "Warning", "Please select start and goal cities")
             return
 
-        # Get algorithm name from dropdown
-        algo_label = self.algo_combo.currentText()
-
-        # Convert display name to short key with robust fallback
-        algorithm = self._ALGO_LABEL_TO_KEY.get(algo_label)
-
-        if algorithm is None:
-            # Fallback: extract short name from "NAME (Description)" format
-            if "(" in algo_label:
-                algorithm = algo_label.split("(")[0].strip()
-            else:
-                algorithm = algo_label.split()[0]
+        # Algorithm key stored with the dropdown item (see algorithm_key)
+        algorithm = self.algo_combo.currentData()
 
         # Validate that we have a valid algorithm
         if not algorithm:
-            QMessageBox.warning(self, "Warning", f"Invalid algorithm selected: {algo_label}")
+            QMessageBox.warning(self, "Warning", f"Invalid algorithm selected: {self.algo_combo.currentText()}")
+            return
+
+        # start == goal needs no search at all
+        if start == goal:
+            self.display_result(self.trivial_result(normalize_algorithm_name(algorithm), start))
+            self.statusBar.showMessage("Search complete (start is the goal)")
+            return
+
+        # Repeat searches are answered from the cache without starting a worker
+        cached = self.cached_result(algorithm, start, goal)
+        if cached is not None:
+            self.display_result(cached)
+            self.statusBar.showMessage("Search complete (cached)")
             return
 
         try:
             self.statusBar.showMessage(f"Running {algorithm}...")
 
-            # Create worker thread
-            self.worker = AlgorithmWorker(self.route_planner, algorithm, start, goal)
-            self.worker.progress.connect(self.statusBar.showMessage)
-            self.worker.result.connect(self.display_result)
-            self.worker.error.connect(lambda msg: QMessageBox.critical(self, "Error", msg))
-            self.worker.finished.connect(lambda: self.statusBar.showMessage("Search complete"))
-            self.worker.start()
+            # Run the search on the search pool; the Run button and toolbar action stay
+            # disabled until search_done / search_failed, so only one search is in flight
+            runnable = AlgoRunnable(self.route_planner, algorithm, start, goal)
+            runnable.signals.result.connect(self.search_done)
+            runnable.signals.error.connect(self.search_failed)
+            self.search_runnable = runnable
+            self.run_button.setEnabled(False)
+            self.run_action.setEnabled(False)
+            self.search_pool.start(runnable)
 
         except Exception as e:
+            self.search_runnable = None
+            self.run_button.setEnabled(True)
+            self.run_action.setEnabled(True)
             import traceback
             error_msg = f"Search failed: {str(e)}\n{traceback.format_exc()}"
             QMessageBox.critical(self, "Error", error_msg)
 
+    @staticmethod
+    def trivial_result(algorithm, city):
+        """What every algorithm returns when start and goal are the same city"""
+        return SearchResult(
+            algorithm_name=algorithm,
+            start=city,
+            goal=city,
+            path=[city],
+            cost=0.0,
+            nodes_expanded=0,
+            runtime=0.0,
+            is_optimal=True
+        )
+
+    def search_done(self, result):
+        """Slot for the single search's result"""
+        self.run_button.setEnabled(True)
+        self.run_action.setEnabled(True)
+        self.search_runnable = None
+        self.display_result(result)
+        self.statusBar.showMessage("Search complete")
+
+    def search_failed(self, error_msg):
+        """Slot for the single search's failure"""
+        self.run_button.setEnabled(True)
+        self.run_action.setEnabled(True)
+        algorithm = self.search_runnable.algorithm if self.search_runnable else "Algorithm"
+        self.search_runnable = None
+        QMessageBox.critical(self, "Error", error_msg)
+        self.statusBar.showMessage(f"{algorithm} search failed")
+
+    def cached_result(self, algorithm, start, goal):
+        """A previous SearchResult for this query, or None"""
+        key = (normalize_algorithm_name(algorithm), start, goal)
+        result = self.result_cache.get(key)
+        if result is not None:
+            self.result_cache.move_to_end(key)
+        return result
+
+    def cache_result(self, result):
+        """Remember a result for cached_result, dropping the oldest past RESULT_CACHE_SIZE"""
+        key = (result.algorithm_name, result.start, result.goal)
+        self.result_cache[key] = result
+        self.result_cache.move_to_end(key)
+        if len(self.result_cache) > self.RESULT_CACHE_SIZE:
+            self.result_cache.popitem(last=False)
+
     def display_result(self, result):
         """Display search result"""
         self.current_results.append(result)
+        self.cache_result(result)
 
         # Update results text
         result_text = f"\n{'='*50}\n"
@@ -753,102 +1049,61 @@ class RouteFinderGUI(QMainWindow):
             return
 
         try:
-            # Clear and redraw the graph
-            self.visualizer.figure = self.graph_figure
-            self.visualizer.ax = self.graph_figure.clear()
-            self.visualizer.ax = self.graph_figure.add_subplot(111)
-
-            # Get the partial path
+            # Get the partial path, and its coordinates in one gather
             partial_path = result.path[:num_steps]
+            lons, lats = self.visualizer.path_coordinates(partial_path)
             hide_non_route = self.hide_non_route_checkbox.isChecked()
 
+            # Clear the previous step (the network image is kept if it's already up)
+            self.reset_graph_axes(keep_network=not hide_non_route)
+
+            last = len(partial_path) - 1
             if hide_non_route:
                 # Draw only nodes in the partial path
-                route_set = set(partial_path)
 
                 # Draw edges between consecutive nodes in partial path
-                for i in range(len(partial_path) - 1):
-                    city1 = partial_path[i]
-                    city2 = partial_path[i + 1]
-
-                    if city1 in self.graph.cities and city2 in self.graph.cities:
-                        city_obj1 = self.graph.cities[city1]
-                        city_obj2 = self.graph.cities[city2]
-
-                        if (hasattr(city_obj1, 'latitude') and hasattr(city_obj1, 'longitude') and
-                            hasattr(city_obj2, 'latitude') and hasattr(city_obj2, 'longitude')):
-
-                            lon1, lat1 = city_obj1.longitude, city_obj1.latitude
-                            lon2, lat2 = city_obj2.longitude, city_obj2.latitude
-
-                            # Draw edge with animation effect (thicker for latest edge)
-                            if i == len(partial_path) - 2:
-                                self.visualizer.ax.plot([lon1, lon2], [lat1, lat2],
-                                                       'orange', linewidth=3, alpha=0.8, zorder=3)
-                            else:
-                                self.visualizer.ax.plot([lon1, lon2], [lat1, lat2],
-                                                       'gray', linewidth=1, alpha=0.5, zorder=1)
+                for i in range(last):
+                    # Draw edge with animation effect (thicker for latest edge)
+                    if i == last - 1:
+                        self.visualizer.ax.plot(lons[i:i + 2], lats[i:i + 2],
+                                               'orange', linewidth=3, alpha=0.8, zorder=3)
+                    else:
+                        self.visualizer.ax.plot(lons[i:i + 2], lats[i:i + 2],
+                                               'gray', linewidth=1, alpha=0.5, zorder=1)
 
                 # Draw nodes in partial path
                 for idx, city in enumerate(partial_path):
-                    if city in self.graph.cities:
-                        city_obj = self.graph.cities[city]
-                        if hasattr(city_obj, 'latitude') and hasattr(city_obj, 'longitude'):
-                            lon = city_obj.longitude
-                            lat = city_obj.latitude
-
-                            # Color coding
-                            if city == result.start:
-                                self.visualizer.ax.plot(lon, lat, 'go', markersize=12, zorder=6)
-                            elif city == result.goal and idx == len(partial_path) - 1:
-                                # Only show goal if we've reached it
-                                self.visualizer.ax.plot(lon, lat, 'bs', markersize=12, zorder=6)
-                            elif idx == len(partial_path) - 1:
-                                # Highlight the current node being added
-                                self.visualizer.ax.plot(lon, lat, 'yo', markersize=10, zorder=5,
-                                                       markeredgecolor='orange', markeredgewidth=2)
-                            else:
-                                self.visualizer.ax.plot(lon, lat, 'co', markersize=8, zorder=4)
-
-                            # Add city label
-                            self.visualizer.ax.annotate(city, (lon, lat),
-                                                       textcoords="offset points",
-                                                       xytext=(0, 5), ha='center',
-                                                       fontsize=2, zorder=1)
+                    lon, lat = lons[idx], lats[idx]
+
+                    # Color coding
+                    if city == result.start:
+                        self.visualizer.ax.plot(lon, lat, 'go', markersize=12, zorder=6)
+                    elif city == result.goal and idx == last:
+                        # Only show goal if we've reached it
+                        self.visualizer.ax.plot(lon, lat, 'bs', markersize=12, zorder=6)
+                    elif idx == last:
+                        # Highlight the current node being added
+                        self.visualizer.ax.plot(lon, lat, 'yo', markersize=10, zorder=5,
+                                               markeredgecolor='orange', markeredgewidth=2)
+                    else:
+                        self.visualizer.ax.plot(lon, lat, 'co', markersize=8, zorder=4)
+
+                    # Add city label
+                    self.visualizer.ax.annotate(city, (lon, lat),
+                                               textcoords="offset points",
+                                               xytext=(0, 5), ha='center',
+                                               fontsize=2, zorder=1)
             else:
                 # Draw the full graph
-                self.visualizer.draw_graph(
-                    show_weights=self.show_weights_checkbox.isChecked(),
-                    title=f"Route: {result.start} → {result.goal} ({result.algorithm_name})"
-                )
+                self.draw_network_background(self.show_weights_checkbox.isChecked())
 
-                # Highlight nodes we've visited so far
-                for idx, city in enumerate(partial_path):
-                    if city in self.graph.cities:
-                        city_obj = self.graph.cities[city]
-                        if hasattr(city_obj, 'latitude') and hasattr(city_obj, 'longitude'):
-                            lon = city_obj.longitude
-                            lat = city_obj.latitude
-
-                            if idx == len(partial_path) - 1:
-                                # Current node - yellow with orange edge
-                                self.visualizer.ax.plot(lon, lat, 'yo', markersize=10, zorder=5,
-                                                       markeredgecolor='orange', markeredgewidth=2)
+                # Current node - yellow with orange edge
+                self.visualizer.ax.plot(lons[last], lats[last], 'yo', markersize=10, zorder=5,
+                                       markeredgecolor='orange', markeredgewidth=2)
 
             # Draw the partial path line if show_path is checked
             if self.show_path_checkbox.isChecked() and len(partial_path) > 1:
-                path_positions = []
-                for city in partial_path:
-                    if city in self.graph.cities:
-                        city_obj = self.graph.cities[city]
-                        if hasattr(city_obj, 'latitude') and hasattr(city_obj, 'longitude'):
-                            lon = city_obj.longitude
-                            lat = city_obj.latitude
-                            path_positions.append((lon, lat))
-
-                if len(path_positions) >= 2:
-                    lons = [pos[0] for pos in path_positions]
-                    lats = [pos[1] for pos in path_positions]
+                if len(lons) >= 2:
                     self.visualizer.ax.plot(lons, lats, 'r-', linewidth=3, label='Path', zorder=5)
 
                     # Mark start and goal
@@ -866,7 +1121,7 @@ class RouteFinderGUI(QMainWindow):
             self.visualizer.ax.set_ylabel("Latitude")
             self.visualizer.ax.grid(True, alpha=0.3)
 
-            self.graph_canvas.draw()
+            self.show_graph_overlays()
 
         except Exception as e:
             print(f"[DEBUG] Animation error: {e}")
@@ -878,81 +1133,56 @@ class RouteFinderGUI(QMainWindow):
         # Update visualization - simplified approach without draw_search_result
         if self.visualizer:
             try:
-                # Clear and redraw the graph
-                self.visualizer.figure = self.graph_figure
-                self.visualizer.ax = self.graph_figure.clear()
-                self.visualizer.ax = self.graph_figure.add_subplot(111)
-
                 # Check if we should hide non-route nodes
                 hide_non_route = self.hide_non_route_checkbox.isChecked()
 
+                # Nothing to do if this exact view is already on the canvas (e.g. a rerun
+                # of the same query); the network image count covers a render arriving
+                view = (result.algorithm_name, result.start, result.goal, tuple(result.path),
+                        hide_non_route, self.show_path_checkbox.isChecked(),
+                        self.show_weights_checkbox.isChecked(), len(self.network_images))
+                if view == self.last_drawn_view:
+                    return
+
+                # Clear the previous route (the network image is kept if it's already up)
+                self.reset_graph_axes(keep_network=not (hide_non_route and result.path))
+
+                # Positions of the cities on the route, in one gather
+                lons, lats = self.visualizer.path_coordinates(result.path)
+
                 if hide_non_route and result.path:
                     # Draw only the nodes in the route
-                    route_set = set(result.path)
 
                     # Draw edges between route nodes
                     for i in range(len(result.path) - 1):
-                        city1 = result.path[i]
-                        city2 = result.path[i + 1]
-
-                        if city1 in self.graph.cities and city2 in self.graph.cities:
-                            city_obj1 = self.graph.cities[city1]
-                            city_obj2 = self.graph.cities[city2]
-
-                            if (hasattr(city_obj1, 'latitude') and hasattr(city_obj1, 'longitude') and
-                                hasattr(city_obj2, 'latitude') and hasattr(city_obj2, 'longitude')):
-
-                                lon1, lat1 = city_obj1.longitude, city_obj1.latitude
-                                lon2, lat2 = city_obj2.longitude, city_obj2.latitude
-
-                                # Draw edge
-                                self.visualizer.ax.plot([lon1, lon2], [lat1, lat2],
-                                                       'gray', linewidth=1, alpha=0.5, zorder=1)
+                        self.visualizer.ax.plot(lons[i:i + 2], lats[i:i + 2],
+                                               'gray', linewidth=1, alpha=0.5, zorder=1)
 
                     # Draw route nodes
-                    for city in result.path:
-                        if city in self.graph.cities:
-                            city_obj = self.graph.cities[city]
-                            if hasattr(city_obj, 'latitude') and hasattr(city_obj, 'longitude'):
-                                lon = city_obj.longitude
-                                lat = city_obj.latitude
-
-                                # Different colors for start, goal, and intermediate nodes
-                                if city == result.start:
-                                    self.visualizer.ax.plot(lon, lat, 'go', markersize=12, zorder=6)
-                                elif city == result.goal:
-                                    self.visualizer.ax.plot(lon, lat, 'bs', markersize=12, zorder=6)
-                                else:
-                                    self.visualizer.ax.plot(lon, lat, 'co', markersize=8, zorder=4)
-
-                                # Add city label
-                                self.visualizer.ax.annotate(city, (lon, lat),
-                                                           textcoords="offset points",
-                                                           xytext=(0, 5), ha='center',
-                                                           fontsize=2, zorder=1)
+                    for idx, city in enumerate(result.path):
+                        lon, lat = lons[idx], lats[idx]
+
+                        # Different colors for start, goal, and intermediate nodes
+                        if city == result.start:
+                            self.visualizer.ax.plot(lon, lat, 'go', markersize=12, zorder=6)
+                        elif city == result.goal:
+                            self.visualizer.ax.plot(lon, lat, 'bs', markersize=12, zorder=6)
+                        else:
+                            self.visualizer.ax.plot(lon, lat, 'co', markersize=8, zorder=4)
+
+                        # Add city label
+                        self.visualizer.ax.annotate(city, (lon, lat),
+                                                   textcoords="offset points",
+                                                   xytext=(0, 5), ha='center',
+                                                   fontsize=2, zorder=1)
                 else:
                     # Draw the full graph
-                    self.visualizer.draw_graph(
-                        show_weights=self.show_weights_checkbox.isChecked(),
-                        title=f"Route: {result.start} → {result.goal} ({result.algorithm_name})"
-                    )
+                    self.draw_network_background(self.show_weights_checkbox.isChecked())
 
                 # Always draw the path if show_path is checked
                 if self.show_path_checkbox.isChecked() and result.path and len(result.path) > 1:
-                    # Get positions of cities in the path
-                    path_positions = []
-                    for city in result.path:
-                        if city in self.graph.cities:
-                            city_obj = self.graph.cities[city]
-                            if hasattr(city_obj, 'latitude') and hasattr(city_obj, 'longitude'):
-                                lon = city_obj.longitude
-                                lat = city_obj.latitude
-                                path_positions.append((lon, lat))
-
                     # Draw the path as a thick red line
-                    if len(path_positions) >= 2:
-                        lons = [pos[0] for pos in path_positions]
-                        lats = [pos[1] for pos in path_positions]
+                    if len(lons) >= 2:
                         self.visualizer.ax.plot(lons, lats, 'r-', linewidth=3, label='Path', zorder=5)
 
                         # Mark start and goal with legend
@@ -968,7 +1198,8 @@ class RouteFinderGUI(QMainWindow):
                 self.visualizer.ax.set_ylabel("Latitude")
                 self.visualizer.ax.grid(True, alpha=0.3)
 
-                self.graph_canvas.draw()
+                self.show_graph_overlays()
+                self.last_drawn_view = view
 
             except Exception as e:
                 print(f"[DEBUG] Visualization error: {e}")
@@ -1006,78 +1237,184 @@ class RouteFinderGUI(QMainWindow):
             algo for algo, checkbox in self.algo_checkboxes.items()
             if checkbox.isChecked()
         ]
-        print(selected_algos)
         if not selected_algos:
             QMessageBox.warning(self, "Warning", "Please select at least one algorithm")
             return
 
-        try:
-            self.statusBar.showMessage("Running comparison...")
+        if self.comparison_remaining:
+            return  # the previous comparison is still running
 
-            # Run comparison
-            parallel = self.parallel_checkbox.isChecked()
-            comparison = self.route_planner.run_comparison(
-                start, goal, selected_algos, parallel
-            )
+        # start == goal: every algorithm returns the one-city path, no need to run them
+        if start == goal:
+            self.show_comparison(ComparisonResult(
+                start=start, goal=goal,
+                results=[self.trivial_result(normalize_algorithm_name(a), start) for a in selected_algos]
+            ))
+            return
 
-            self.comparison_result = comparison
+        # Algorithms already run on this pair (in either tab) come from the cache
+        self.comparison_request = (start, goal, selected_algos)
+        self.comparison_results = []
+        pending = []
+        for algo in selected_algos:
+            cached = self.cached_result(algo, start, goal)
+            if cached is not None:
+                self.comparison_results.append(cached)
+            else:
+                pending.append(algo)
+        if not pending:
+            self.show_comparison(ComparisonResult(start=start, goal=goal, results=self.comparison_results))
+            return
 
-            # Update table
-            self.comparison_table.setRowCount(len(comparison.results))
-            for i, result in enumerate(comparison.results):
-                self.comparison_table.setItem(i, 0, QTableWidgetItem(result.algorithm_name))
-                self.comparison_table.setItem(i, 1, QTableWidgetItem(str(len(result.path))))
-                self.comparison_table.setItem(i, 2, QTableWidgetItem(f"{result.cost:.1f}"))
-                self.comparison_table.setItem(i, 3, QTableWidgetItem(str(result.nodes_expanded)))
-                self.comparison_table.setItem(i, 4, QTableWidgetItem(f"{result.runtime * 1000:.3f}"))
-
-                optimal_text = "Yes" if result.is_optimal else "No"
-                optimal_item = QTableWidgetItem(optimal_text)
-                if result.is_optimal:
-                    optimal_item.setBackground(QColor(200, 255, 200))
-                else:
-                    optimal_item.setBackground(QColor(255, 200, 200))
-                self.comparison_table.setItem(i, 5, optimal_item)
+        try:
+            # One runnable per algorithm on the comparison pool. Without "Run in Parallel"
+            # the pool has one thread and the runnables share the (start, goal) search
+            # context; with it, each runnable waits on a search in the planner's
+            # worker processes, which build their own (with one core there'd be a single
+            # worker, so the serial path is used instead, as in RoutePlanner.run_comparison)
+            parallel = self.parallel_checkbox.isChecked() and QThread.idealThreadCount() > 1
+            self.comparison_pool.setMaxThreadCount(QThread.idealThreadCount() if parallel else 1)
+            ctx = None if parallel else prepare_search_context(self.graph, start, goal)
+
+            self.comparison_errors = []
+            self.comparison_runnables = []
+            self.comparison_remaining = len(pending)
+            self.compare_button.setEnabled(False)
+            self.statusBar.showMessage("Running comparison...")
 
-            # Update comparison charts
-            self.comparison_figure.clear()
-            comparison_fig = self.visualizer.create_comparison_chart(comparison.results)
+            for algo in pending:
+                runnable = AlgoRunnable(self.route_planner, algo, start, goal, ctx, in_process=parallel)
+                runnable.signals.result.connect(self.comparison_result_ready)
+                runnable.signals.error.connect(self.comparison_error)
+                self.comparison_runnables.append(runnable)
+                self.comparison_pool.start(runnable)
 
-            # Copy the comparison chart to our canvas
-            for ax_src in comparison_fig.axes:
-                ax_dest = self.comparison_figure.add_subplot(
-                    1, 3, comparison_fig.axes.index(ax_src) + 1
-                )
-                # Copy the content (lines)
-                for line in ax_src.lines:
-                    ax_dest.plot(line.get_xdata(), line.get_ydata())
+        except Exception as e:
+            self.comparison_remaining = 0
+            self.compare_button.setEnabled(True)
+            QMessageBox.critical(self, "Error", f"Comparison failed: {str(e)}")
+            self.statusBar.showMessage("Comparison failed")
 
-                # Copy the content (bars)
-                for bar_container in ax_src.containers:
-                    heights = [bar.get_height() for bar in bar_container]
-                    colors = [bar.get_facecolor() for bar in bar_container]
+    def comparison_result_ready(self, result):
+        """Collect one algorithm's result from the comparison pool"""
+        self.comparison_results.append(result)
+        self.cache_result(result)
+        self.comparison_step_done()
+
+    def comparison_error(self, error_msg):
+        """Collect one algorithm's failure from the comparison pool"""
+        self.comparison_errors.append(error_msg)
+        self.comparison_step_done()
+
+    def comparison_step_done(self):
+        """Called once per finished runnable; shows the comparison after the last one"""
+        self.comparison_remaining -= 1
+        if self.comparison_remaining > 0:
+            return
 
-                    # --- FIX 1: Use the full 'colors' list, not just the first element ---
-                    ax_dest.bar(range(len(heights)), heights, color=colors)
+        self.comparison_runnables = []
+        self.compare_button.setEnabled(True)
+        if self.comparison_errors:
+            QMessageBox.critical(self, "Error", f"Comparison failed: {self.comparison_errors[0]}")
+            self.statusBar.showMessage("Comparison failed")
+            return
 
-                ax_dest.set_title(ax_src.get_title())
-                ax_dest.set_xlabel(ax_src.get_xlabel())
-                ax_dest.set_ylabel(ax_src.get_ylabel())
+        # Cached results come first, the rest in completion order; show them in selection order
+        start, goal, selected_algos = self.comparison_request
+        order = {normalize_algorithm_name(a): i for i, a in enumerate(selected_algos)}
+        results = sorted(self.comparison_results, key=lambda r: order.get(r.algorithm_name, 999))
+        self.show_comparison(ComparisonResult(start=start, goal=goal, results=results))
+
+    def set_comparison_row_count(self, rows):
+        """Resize the comparison table, forgetting cached cells Qt deletes with dropped rows"""
+        self.comparison_table.setRowCount(rows)
+        for key in [k for k in self.comparison_cells if k[0] >= rows]:
+            del self.comparison_cells[key]
+
+    def comparison_cell(self, row, col):
+        """The table item at (row, col), created once and reused by later comparisons"""
+        item = self.comparison_cells.get((row, col))
+        if item is None:
+            item = QTableWidgetItem()
+            self.comparison_table.setItem(row, col, item)
+            self.comparison_cells[(row, col)] = item
+        return item
+
+    def chart_pixel_size(self):
+        """(width, height) in device pixels the comparison chart is rendered at"""
+        ratio = self.comparison_chart.devicePixelRatioF()
+        return (max(int(self.comparison_chart.width() * ratio), 1),
+                max(int(self.comparison_chart.height() * ratio), 1))
+
+    def render_comparison_chart(self):
+        """
+        Start a ChartWorker for comparison_result at the label's current size, unless
+        that is already shown. While a render is running the next one waits for it:
+        chart_rendered picks up whatever changed in the meantime.
+        """
+        comparison = self.comparison_result
+        if comparison is None or not comparison.results:
+            return
+        key = (comparison, self.chart_pixel_size())
+        shown = self.chart_rendered_for
+        if shown is not None and shown[0] is comparison and shown[1] == key[1]:
+            return
+        if self.chart_worker is not None and self.chart_worker.isRunning():
+            return
 
-                # --- FIX 2: Explicitly set ticks to match the data range (0, 1, 2...) ---
-                # This ensures the labels align correctly with the bars
-                ax_dest.set_xticks(range(len(comparison.results)))
-                ax_dest.set_xticklabels([r.algorithm_name for r in comparison.results])
+        ratio = self.comparison_chart.devicePixelRatioF()
+        dpi = rcParams['figure.dpi'] * ratio
+        width, height = key[1]
+        self.chart_worker = ChartWorker(key, comparison, (width / dpi, height / dpi), dpi)
+        self.chart_worker.rendered.connect(self.chart_rendered)
+        self.chart_worker.error.connect(self.render_failed)
+        self.chart_worker.start()
+
+    def chart_rendered(self, key, rgba):
+        """Show a finished chart, then render again if the comparison or size moved on"""
+        height, width = rgba.shape[:2]
+        image = QImage(rgba.data, width, height, rgba.strides[0], QImage.Format.Format_RGBA8888)
+        pixmap = QPixmap.fromImage(image)
+        pixmap.setDevicePixelRatio(self.comparison_chart.devicePixelRatioF())
+        self.comparison_chart.setPixmap(pixmap)
+        self.chart_rendered_for = key
+        self.render_comparison_chart()
+
+    def show_comparison(self, comparison):
+        """Fill the comparison table and charts"""
+        try:
+            self.comparison_result = comparison
 
-                ax_dest.grid(True, alpha=0.3)
+            # Update table
+            # repaints / signals / sorting are held off while the cells are filled,
+            # so the view is refreshed once instead of after every setItem
+            table = self.comparison_table
+            sorting = table.isSortingEnabled()
+            table.setUpdatesEnabled(False)
+            table.setSortingEnabled(False)
+            table.blockSignals(True)
+            try:
+                self.set_comparison_row_count(len(comparison.results))
+                for i, result in enumerate(comparison.results):
+                    self.comparison_cell(i, 0).setText(result.algorithm_name)
+                    self.comparison_cell(i, 1).setText(str(len(result.path)))
+                    self.comparison_cell(i, 2).setText(f"{result.cost:.1f}")
+                    self.comparison_cell(i, 3).setText(str(result.nodes_expanded))
+                    self.comparison_cell(i, 4).setText(f"{result.runtime * 1000:.3f}")
+
+                    optimal_item = self.comparison_cell(i, 5)
+                    optimal_item.setText("Yes" if result.is_optimal else "No")
+                    if result.is_optimal:
+                        optimal_item.setBackground(self.OPTIMAL_BG)
+                    else:
+                        optimal_item.setBackground(self.NON_OPTIMAL_BG)
+            finally:
+                table.blockSignals(False)
+                table.setSortingEnabled(sorting)
+                table.setUpdatesEnabled(True)
 
-            self.comparison_figure.suptitle(
-                f'Algorithm Comparison: {start} to {goal}',
-                fontsize=14,
-                fontweight='bold'
-            )
-            self.comparison_figure.tight_layout(rect=[0, 0, 1, 0.96])
-            self.comparison_canvas.draw()
+            # Update comparison charts
+            self.render_comparison_chart()
 
             # Update status
             optimal_str = ", ".join(comparison.optimal_algorithms)
@@ -1094,21 +1431,158 @@ class RouteFinderGUI(QMainWindow):
     def refresh_graph(self):
         """Refresh the graph visualization"""
         if self.visualizer:
+            # Already showing the bare network (e.g. Clear Results twice): nothing to redraw
+            view = ("network", self.show_weights_checkbox.isChecked(), len(self.network_images))
+            if view == self.last_drawn_view:
+                return
+
+            self.reset_graph_axes(keep_network=True, facecolor='#aab7a4')
+
+            self.draw_network_background(self.show_weights_checkbox.isChecked())
+            self.visualizer.ax.set_title("New York State Route Network", fontsize=14, fontweight='bold')
+            self.visualizer.ax.set_xlabel("Longitude")
+            self.visualizer.ax.set_ylabel("Latitude")
+            self.visualizer.ax.grid(True, alpha=0.3)
+            self.show_graph_overlays()
+            self.last_drawn_view = view
+
+    def reset_graph_axes(self, keep_network=False, facecolor=None):
+        """
+        Prepare the graph axes for a redraw. With keep_network, axes that already
+        show the network image are reused and only the overlays drawn on top of it
+        (path lines, markers, labels, legend) are removed; otherwise the figure is
+        cleared and a fresh subplot is added.
+        """
+        self.last_drawn_view = None  # whatever is drawn next replaces the current view
+        ax = self.visualizer.ax
+        image = self.network_image_artist
+        facecolor = facecolor or rcParams['axes.facecolor']
+        if keep_network and image is not None and image.axes is ax:
+            for artist in [*ax.lines, *ax.collections, *ax.texts, *ax.patches]:
+                artist.remove()
+            legend = ax.get_legend()
+            if legend is not None:
+                legend.remove()
+            if ax.get_facecolor() != to_rgba(facecolor):
+                self.graph_background = None
+        else:
             self.visualizer.figure = self.graph_figure
-            self.visualizer.ax = self.graph_figure.clear()
-            self.visualizer.ax = self.graph_figure.add_subplot(111)
-            self.visualizer.ax.set_facecolor('#aab7a4')
+            self.graph_figure.clear()
+            self.visualizer.ax = ax = self.graph_figure.add_subplot(111)
+            self.network_image_artist = None
+            self.graph_background = None
+        ax.set_facecolor(facecolor)
+
+    def graph_overlays(self):
+        """What's drawn over the network image: route, markers, labels, legend and title"""
+        ax = self.visualizer.ax
+        overlays = [*ax.lines, *ax.collections, *ax.texts, *ax.patches, ax.title]
+        legend = ax.get_legend()
+        if legend is not None:
+            overlays.append(legend)
+        return sorted(overlays, key=lambda artist: artist.get_zorder())
+
+    def show_graph_overlays(self):
+        """
+        Put the current view on screen. Over the network image the overlays are
+        animated artists, left out of full draws: graph_canvas_drawn saves the
+        pixels without them, and a view that only changed overlays (a new route,
+        an animation step) restores those pixels and blits the overlays on top
+        instead of redrawing, and resampling, the whole image.
+        """
+        ax = self.visualizer.ax
+        image = self.network_image_artist
+        if image is None or image.axes is not ax:
+            self.graph_canvas.draw_idle()
+            return
 
-            self.visualizer.draw_graph(
-                show_weights=self.show_weights_checkbox.isChecked(),
-                title="New York State Route Network"
-            )
-            self.graph_canvas.draw()
+        overlays = self.graph_overlays()
+        for artist in overlays:
+            artist.set_animated(True)
+        if self.graph_background is None:
+            self.graph_canvas.draw_idle()  # graph_canvas_drawn adds the overlays
+            return
+
+        self.graph_canvas.restore_region(self.graph_background)
+        for artist in overlays:
+            ax.draw_artist(artist)
+        self.graph_canvas.blit(self.graph_figure.bbox)
+
+    def graph_canvas_drawn(self, event):
+        """draw_event of the graph canvas: save the background, then draw the overlays on it"""
+        if self.graph_canvas.is_saving() or not self.visualizer:
+            return  # savefig draws the animated artists itself
+        self.graph_background = self.graph_canvas.copy_from_bbox(self.graph_figure.bbox)
+        ax = self.visualizer.ax
+        for artist in self.graph_overlays():
+            if artist.get_animated():
+                ax.draw_artist(artist)
+
+    def draw_network_background(self, show_weights):
+        """
+        Put the full network on the graph axes as one image. The image is rendered
+        by a RenderWorker the first time (the axes stay empty until it arrives and
+        the current view is redrawn), then reused for every later redraw.
+        """
+        key = bool(show_weights)
+        cached = self.network_images.get(key)
+        if cached is None:
+            self.start_network_render(key)
+            return
+
+        ax = self.visualizer.ax
+        image = self.network_image_artist
+        if image is not None and image.axes is ax:
+            if self.network_image_key == key:
+                return  # still up from the last draw
+            image.remove()
+
+        rgba, extent = cached
+        self.network_image_artist = ax.imshow(rgba, extent=extent, origin='upper', zorder=0)
+        self.graph_background = None
+        self.network_image_key = key
+        ax.set_xlim(extent[0], extent[1])
+        ax.set_ylim(extent[2], extent[3])
+        ax.set_aspect('equal', adjustable='box')
+
+    def start_network_render(self, key):
+        """Render the network for `key` in the background unless that's already running"""
+        if self.render_worker is not None and self.render_worker.isRunning():
+            return
+        self.statusBar.showMessage("Rendering graph...")
+        # 2x the on-screen resolution so zooming in with the toolbar stays readable
+        self.render_worker = RenderWorker(
+            self.visualizer, key, key,
+            tuple(self.graph_figure.get_size_inches()), self.graph_figure.dpi * 2
+        )
+        self.render_worker.rendered.connect(self.network_rendered)
+        self.render_worker.error.connect(self.render_failed)
+        self.render_worker.start()
+
+    def network_rendered(self, key, rgba, extent):
+        """Cache a finished render and redraw whatever is currently shown"""
+        self.network_images[key] = (rgba, extent)
+        self.statusBar.showMessage("Ready")
+
+        # a running animation picks the image up on its next step
+        if self.animation_timer and self.animation_timer.isActive():
+            return
+        if self.current_results:
+            self.draw_static_result(self.current_results[-1])
+        else:
+            self.refresh_graph()
+
+    def render_failed(self, error_msg):
+        """Slot for a background render's failure"""
+        QMessageBox.critical(self, "Error", error_msg)
+        self.statusBar.showMessage("Rendering failed")
 
     def update_statistics(self):
         """Update graph statistics display"""
         if self.graph:
-            stats = get_graph_statistics(self.graph)
+            if self.graph_stats is None:
+                self.graph_stats = get_graph_statistics(self.graph)
+            stats = self.graph_stats
 
             self.stats_labels["total_cities"].setText(str(stats['total_cities']))
             self.stats_labels["total_edges"].setText(str(stats['total_edges']))
@@ -1128,7 +1602,7 @@ class RouteFinderGUI(QMainWindow):
         self.animation_result = None
 
         self.results_text.clear()
-        self.comparison_table.setRowCount(0)
+        self.set_comparison_row_count(0)
         self.refresh_graph()
         self.statusBar.showMessage("Results cleared")
 
@@ -1165,8 +1639,9 @@ class RouteFinderGUI(QMainWindow):
                         'least_expanded': self.comparison_result.least_expanded_algorithm
                     }
 
+                    # json.dumps + one write; json.dump writes every encoded chunk separately
                     with open(filename, 'w') as f:
-                        json.dump(data, f, indent=2)
+                        f.write(json.dumps(data, indent=2))
 
                 elif filename.endswith('.csv'):
                     # Export as CSV
@@ -1177,15 +1652,17 @@ class RouteFinderGUI(QMainWindow):
                             'Algorithm', 'Path', 'Cost', 'Nodes Expanded',
                             'Runtime (ms)', 'Optimal'
                         ])
-                        for r in self.comparison_result.results:
-                            writer.writerow([
+                        writer.writerows(
+                            [
                                 r.algorithm_name,
                                 ' -> '.join(r.path),
                                 r.cost,
                                 r.nodes_expanded,
                                 r.runtime * 1000,
                                 r.is_optimal
-                            ])
+                            ]
+                            for r in self.comparison_result.results
+                        )
 
                 QMessageBox.information(self, "Success", f"Results exported to {filename}")
 
@@ -1198,6 +1675,19 @@ class RouteFinderGUI(QMainWindow):
         if directory:
             self.export_path_label.setText(f"Export Path: {directory}")
 
+    def closeEvent(self, event):
+        """Save the result cache for the next session and stop the planner's worker processes"""
+        if self.data_files is not None and self.result_cache:
+            cities_csv, edges_csv = self.data_files
+            save_result_cache(default_result_cache_file(cities_csv), cities_csv, edges_csv, self.result_cache)
+        # drop queued comparison runnables and let running ones finish first, so none
+        # of them submits to the planner after its worker processes are shut down
+        self.comparison_pool.clear()
+        self.comparison_pool.waitForDone()
+        if self.route_planner is not None:
+            self.route_planner.close()
+        super().closeEvent(event)
+
     def show_about(self):
         """Show about dialog"""
         QMessageBox.about(
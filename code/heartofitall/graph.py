@@ -1,7 +1,13 @@
 from __future__ import annotations
 from dataclasses import dataclass
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from typing import Dict, Iterable, List, Optional, Tuple
+
+# NumPy (see requirements.txt) backs get_coordinate_matrix; the rest of Graph is plain Python
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
 
 @dataclass(frozen=True)
 class City:
@@ -14,16 +20,73 @@ class Graph:
         self.cities: Dict[str, City] = {}
         # adjacency[u][v] = distance (miles)
         self.adjacency: Dict[str, Dict[str, float]] = defaultdict(dict)
+        # contiguous int ids, assigned in insertion order
+        self._id_of: Dict[str, int] = {}
+        self._name_of: List[str] = []
+        # CSR layout (indptr, indices, weights), rebuilt lazily after mutation
+        self._csr: Optional[Tuple[List[int], List[int], List[float]]] = None
+        self._coords: Optional[Tuple[List[float], List[float]]] = None
+        self._coord_matrix = None  # (N, 2) float64 ndarray of (lat, lon), see get_coordinate_matrix
+        self._sorted_cities: Optional[List[str]] = None
+        # set once any one-way edge is added; until then the reverse CSR is the CSR itself
+        self._directed = False
+        self._reverse_csr: Optional[Tuple[List[int], List[int], List[float]]] = None
+
+    def _intern(self, name: str) -> int:
+        node_id = self._id_of.get(name)
+        if node_id is None:
+            node_id = len(self._name_of)
+            self._id_of[name] = node_id
+            self._name_of.append(name)
+        return node_id
+
+    def _reset_views(self) -> None:
+        # drop the lazily built views after a mutation
+        self._csr = None
+        self._reverse_csr = None
+        self._coords = None
+        self._coord_matrix = None
 
     # city / edge management
     def add_city(self, name: str, lat: float, lon: float) -> None:
         self.cities[name] = City(name, float(lat), float(lon))
+        self._intern(name)
+        self._sorted_cities = None
+        self._reset_views()
 
     def add_edge(self, a: str, b: str, distance: float, bidirectional: bool = True) -> None:
         d = float(distance)
         self.adjacency[a][b] = d
         if bidirectional:
             self.adjacency[b][a] = d
+        else:
+            self._directed = True
+        self._intern(a)
+        self._intern(b)
+        self._reset_views()
+
+    def add_cities(self, rows: Iterable[Tuple[str, float, float]]) -> None:
+        """add_city for each (name, lat, lon), resetting the cached views once"""
+        cities = self.cities
+        for name, lat, lon in rows:
+            cities[name] = City(name, float(lat), float(lon))
+            self._intern(name)
+        self._sorted_cities = None
+        self._reset_views()
+
+    def add_edges(self, rows: Iterable[Tuple[str, str, float]], bidirectional: bool = True) -> None:
+        """add_edge for each (a, b, distance), resetting the cached views once"""
+        adjacency = self.adjacency
+        for a, b, distance in rows:
+            d = float(distance)
+            adjacency[a][b] = d
+            if bidirectional:
+                adjacency[b][a] = d
+            self._intern(a)
+            self._intern(b)
+        if not bidirectional:
+            self._directed = True
+        self._reset_views()
 
     # queries used by algs
     def get_neighbors(self, city: str) -> Dict[str, float]:
@@ -35,6 +98,82 @@ class Graph:
     def get_all_cities(self) -> List[str]:
         return list(self.cities.keys())
 
+    def get_sorted_cities(self) -> List[str]:
+        """City names in sorted order; kept with the graph, so a pickled snapshot doesn't re-sort"""
+        if self._sorted_cities is None:
+            self._sorted_cities = sorted(self.cities)
+        return list(self._sorted_cities)
+
     def get_coordinates(self, city: str) -> Tuple[float, float]:
         c = self.cities[city]
         return (c.latitude, c.longitude)
+
+    # integer-id view used by the array based algs
+    @property
+    def num_nodes(self) -> int:
+        return len(self._name_of)
+
+    def get_node_id(self, city: str) -> int:
+        return self._id_of[city]
+
+    def get_node_name(self, node_id: int) -> str:
+        return self._name_of[node_id]
+
+    def get_csr(self) -> Tuple[List[int], List[int], List[float]]:
+        """
+        Neighbors of node i are indices[indptr[i]:indptr[i + 1]] with the
+        matching distances in weights, in the same order as get_neighbors.
+        """
+        if self._csr is None:
+            indptr = [0]
+            indices: List[int] = []
+            weights: List[float] = []
+            id_of = self._id_of
+            for name in self._name_of:
+                for nbr, d in self.adjacency.get(name, {}).items():
+                    indices.append(id_of[nbr])
+                    weights.append(d)
+                indptr.append(len(indices))
+            self._csr = (indptr, indices, weights)
+        return self._csr
+
+    def get_reverse_csr(self) -> Tuple[List[int], List[int], List[float]]:
+        """CSR of the transposed graph (incoming edges), for backward searches."""
+        if not self._directed:
+            return self.get_csr()
+        if self._reverse_csr is None:
+            incoming: List[List[Tuple[int, float]]] = [[] for _ in self._name_of]
+            id_of = self._id_of
+            for name in self._name_of:
+                u = id_of[name]
+                for nbr, d in self.adjacency.get(name, {}).items():
+                    incoming[id_of[nbr]].append((u, d))
+            indptr = [0]
+            indices: List[int] = []
+            weights: List[float] = []
+            for edges in incoming:
+                for u, d in edges:
+                    indices.append(u)
+                    weights.append(d)
+                indptr.append(len(indices))
+            self._reverse_csr = (indptr, indices, weights)
+        return self._reverse_csr
+
+    def get_coordinate_arrays(self) -> Tuple[List[float], List[float]]:
+        """(lats, lons) indexed by node id."""
+        if self._coords is None:
+            cities = [self.cities[name] for name in self._name_of]
+            self._coords = ([c.latitude for c in cities], [c.longitude for c in cities])
+        return self._coords
+
+    def get_coordinate_matrix(self):
+        """
+        (lat, lon) rows indexed by node id as one contiguous float64 array,
+        or None without NumPy.
+        """
+        if np is None:
+            return None
+        if self._coord_matrix is None:
+            lats, lons = self.get_coordinate_arrays()
+            self._coord_matrix = np.column_stack((lats, lons))
+        return self._coord_matrix
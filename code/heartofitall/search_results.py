@@ -11,6 +11,10 @@ from typing import List
 
 @dataclass
 class SearchResult:
+    # fixed slots instead of a per-instance __dict__ (no field has a default, so this is safe)
+    __slots__ = ("algorithm_name", "start", "goal", "path", "cost",
+                 "nodes_expanded", "runtime", "is_optimal")
+
     algorithm_name: str  # name of the alg used
     start: str  # starting city
     goal: str  # goal city
@@ -1,13 +1,17 @@
+import sys
 from pathlib import Path
+from functools import lru_cache
+from typing import Tuple
 
 from pathlib import Path
-from utilities.data_loader import load_graph
+from utilities.data_loader import load_graph, default_cache_file
 from algorithms.bfs import BFS
 from algorithms.dfs import DFS
 from algorithms.ucs import UCS
 from algorithms.greedy import GreedyBestFirst
 from algorithms.astar import AStar
 from algorithms.ids import IDS
+from algorithms.base_algorithm import prepare_search_context
 
 ALGOS = {
     "DFS": DFS,
@@ -19,18 +23,35 @@ ALGOS = {
 }
 
 
-def run_compare(start: str, goal: str):
+# The graph is loaded once and treated as frozen, so every search result
+# depends only on (start, goal). Call reload_graph() after the CSVs change.
+@lru_cache(maxsize=1)
+def load_default_graph():
     project_root = Path(__file__).parent.parent
     cities_csv = project_root / "data" / "cities.csv"
     edges_csv = project_root / "data" / "edges.csv"
-    g = load_graph(cities_csv, edges_csv)
+    return load_graph(cities_csv, edges_csv, cache_file=default_cache_file(cities_csv))
+
+
+def reload_graph():
+    """Drop the cached graph and every cached comparison built on it."""
+    load_default_graph.cache_clear()
+    run_compare.cache_clear()
+
+
+# repeat clicks on the same destination are served from the cache;
+# returns a tuple so the cached value can't be modified by callers
+@lru_cache(maxsize=64)
+def run_compare(start: str, goal: str) -> Tuple[str, ...]:
+    g = load_default_graph()
+    ctx = prepare_search_context(g, start, goal)  # shared CSR / ids / h table
     results = []
     for name, cls in ALGOS.items():
-        res = cls(g, start, goal).search()
-        print(res)
+        res = cls(g, start, goal, ctx=ctx).search()
         results.append(str(res))
-    return results
+    return tuple(results)
 
 if __name__ == "__main__":
     # Get the project root directory (parent of 'code' directory)
-    run_compare("Rochester", "Yonkers")
+    # one buffered write for the whole report instead of a print per algorithm
+    sys.stdout.write("\n".join(run_compare("Rochester", "Yonkers")) + "\n")
@@ -6,8 +6,9 @@ Handles loading city and edge data from CSV files with flexible headers.
 from __future__ import annotations
 import csv
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Iterator, List, Sequence, Tuple
 import pickle
+import sys
 
 # Import Graph with a safe fallback so the module works in both package and flat layouts
 try:
@@ -17,71 +18,175 @@ except (ImportError, ModuleNotFoundError):
     from code.heartofitall.graph import Graph
 
 
-def _pick(mapping, *candidates):
-    for c in candidates:
-        if c in mapping and mapping[c] not in (None, ""):
-            return mapping[c]
+# header synonyms are resolved once per file, then rows are read by position
+# instead of building a lower-cased dict for every row
+def _normalize_header(header: Sequence[str]) -> List[str]:
+    return [(h or "").strip().lower() for h in header]
+
+
+def _columns(header: List[str], *candidates) -> List[int]:
+    """Positions of the candidate columns present in the header, in candidate order."""
+    position = {h: i for i, h in enumerate(header)}  # last duplicate wins, like DictReader
+    return [position[c] for c in candidates if c in position]
+
+
+def _pick_at(row: List[str], columns: List[int]) -> Optional[str]:
+    for i in columns:
+        if i < len(row):
+            v = row[i].strip()
+            if v:
+                return v
     return None
 
 
+# default snapshot name, kept next to the CSVs (see default_cache_file)
+GRAPH_CACHE_NAME = ".graph_cache.pkl"
+# bump when Graph's pickled attributes change, so older snapshots are reparsed
+GRAPH_CACHE_VERSION = 3
+
+
+def default_cache_file(cities_file: Path) -> Path:
+    return Path(cities_file).with_name(GRAPH_CACHE_NAME)
+
+
+# search results saved between GUI sessions, also kept next to the CSVs
+RESULT_CACHE_NAME = ".result_cache.pkl"
+# bump when the algorithms' output changes (paths, costs, nodes_expanded), so results
+# stored by older code are dropped instead of being shown as fresh runs
+RESULT_CACHE_VERSION = 1
+
+
+def default_result_cache_file(cities_file: Path) -> Path:
+    return Path(cities_file).with_name(RESULT_CACHE_NAME)
+
+
+def _source_stamp(cities_file: Path, edges_file: Path, version: int = GRAPH_CACHE_VERSION) -> Tuple:
+    """Identifies the CSV contents, and the cache `version`, a cached graph or result set was built from."""
+    stamp = [version]
+    for p in (cities_file, edges_file):
+        st = p.stat()
+        stamp.append((str(p.resolve()), st.st_mtime_ns, st.st_size))
+    return tuple(stamp)
+
+
+# Names are interned, so cities, adjacency and the id tables share one string
+# per city (equal names compare by identity, and the snapshot pickles each once)
+def _city_rows(reader) -> Iterator[Tuple[str, float, float]]:
+    """(name, lat, lon) for each row of a cities CSV reader"""
+    header = _normalize_header(next(reader, []))
+    name_cols = _columns(header, "city", "city_name", "name", "node", "id")
+    lat_cols = _columns(header, "latitude", "lat", "y")
+    lon_cols = _columns(header, "longitude", "lon", "lng", "x")
+    for row in reader:
+        if not row:
+            continue  # blank line (DictReader skipped these too)
+        name = _pick_at(row, name_cols)
+        lat = _pick_at(row, lat_cols)
+        lon = _pick_at(row, lon_cols)
+        if name is None or lat is None or lon is None:
+            raise KeyError("City CSV must contain 'city'/'latitude'/'longitude' (or synonyms). "
+                           f"Got headers: {header}")
+        yield sys.intern(name), float(lat), float(lon)
+
+
+def _edge_rows(reader) -> Iterator[Tuple[str, str, float]]:
+    """(city1, city2, distance) for each row of an edges CSV reader"""
+    header = _normalize_header(next(reader, []))
+    a_cols = _columns(header, "city1", "source", "from", "city_a", "a", "source_city")
+    b_cols = _columns(header, "city2", "target", "to", "city_b", "b", "dest_city", "destination_city")
+    dist_cols = _columns(header, "distance", "weight", "w", "distance_miles", "miles", "length")
+    for row in reader:
+        if not row:
+            continue
+        a = _pick_at(row, a_cols)
+        b = _pick_at(row, b_cols)
+        dist = _pick_at(row, dist_cols)
+        if a is None or b is None or dist is None:
+            raise KeyError("Edges CSV must contain 'city1'/'city2'/'distance' (or synonyms). "
+                           f"Got headers: {header}")
+        yield sys.intern(a), sys.intern(b), float(dist)
+
+
 def load_graph(cities_file: Path, edges_file: Path, cache_file: Optional[Path] = None) -> Graph:
     """
     Accepts headers:
       Cities:  city|city_name|name , latitude|lat , longitude|lon|lng
       Edges:   city1|source|from , city2|target|to , distance|distance_miles|weight|miles
+
+    With cache_file, the parsed graph is pickled there together with the CSVs'
+    mtime/size and reused until either CSV changes (delete the file to force a reparse).
     """
     if isinstance(cities_file, str):
         cities_file = Path(cities_file)
     if isinstance(edges_file, str):
         edges_file = Path(edges_file)
 
-    # Optional cache
+    # Optional cache, only trusted if it was built from the current CSVs
+    stamp = _source_stamp(cities_file, edges_file) if cache_file else None
     if cache_file and Path(cache_file).exists():
         try:
             with open(cache_file, "rb") as f:
-                return pickle.load(f)
+                cached_stamp, cached_graph = pickle.load(f)
+            if cached_stamp == stamp and isinstance(cached_graph, Graph):
+                return cached_graph
         except Exception:
             pass
 
     g = Graph()
 
+    # Rows are parsed lazily and streamed into Graph.add_cities / add_edges, so the
+    # views are reset once per file and no list of parsed rows is held in between
     # --- Cities ---
     with open(cities_file, "r", newline="") as f:
-        reader = csv.DictReader(f)
-        for raw in reader:
-            row = {(k or "").strip().lower(): (v or "").strip() for k, v in raw.items()}
-            name = _pick(row, "city", "city_name", "name", "node", "id")
-            lat = _pick(row, "latitude", "lat", "y")
-            lon = _pick(row, "longitude", "lon", "lng", "x")
-            if name is None or lat is None or lon is None:
-                raise KeyError("City CSV must contain 'city'/'latitude'/'longitude' (or synonyms). "
-                               f"Got headers: {list(row.keys())}")
-            g.add_city(name=name, lat=float(lat), lon=float(lon))
+        g.add_cities(_city_rows(csv.reader(f)))
 
     # --- Edges ---
     with open(edges_file, "r", newline="") as f:
-        reader = csv.DictReader(f)
-        for raw in reader:
-            row = {(k or "").strip().lower(): (v or "").strip() for k, v in raw.items()}
-            a = _pick(row, "city1", "source", "from", "city_a", "a", "source_city")
-            b = _pick(row, "city2", "target", "to", "city_b", "b", "dest_city", "destination_city")
-            dist = _pick(row, "distance", "weight", "w", "distance_miles", "miles", "length")
-            if a is None or b is None or dist is None:
-                raise KeyError("Edges CSV must contain 'city1'/'city2'/'distance' (or synonyms). "
-                               f"Got headers: {list(row.keys())}")
-            g.add_edge(a=a, b=b, distance=float(dist), bidirectional=True)
-
-    # Save cache if requested
+        g.add_edges(_edge_rows(csv.reader(f)), bidirectional=True)
+
+    # Save cache if requested, with the lazily built views (sorted city list, CSR
+    # arrays, coordinate matrix) filled in so the first search after a load doesn't build them
     if cache_file:
+        g.get_sorted_cities()
+        g.get_csr()
+        g.get_reverse_csr()
+        g.get_coordinate_matrix()
         try:
             with open(cache_file, "wb") as f:
-                pickle.dump(g, f)
+                pickle.dump((stamp, g), f, protocol=pickle.HIGHEST_PROTOCOL)
         except Exception:
             pass
 
     return g
 
 
+def load_result_cache(cache_file: Path, cities_file: Path, edges_file: Path) -> Dict[Any, Any]:
+    """
+    Results stored by save_result_cache for the current CSVs; empty if the
+    file is missing, unreadable, or was written for other CSV contents or by
+    another RESULT_CACHE_VERSION.
+    """
+    try:
+        with open(cache_file, "rb") as f:
+            cached_stamp, results = pickle.load(f)
+        current = _source_stamp(Path(cities_file), Path(edges_file), RESULT_CACHE_VERSION)
+        if cached_stamp == current and isinstance(results, dict):
+            return results
+    except Exception:
+        pass
+    return {}
+
+
+def save_result_cache(cache_file: Path, cities_file: Path, edges_file: Path, results: Dict[Any, Any]) -> None:
+    """Pickle results with the CSVs' stamp, so load_result_cache drops them once either CSV changes."""
+    try:
+        stamp = _source_stamp(Path(cities_file), Path(edges_file), RESULT_CACHE_VERSION)
+        with open(cache_file, "wb") as f:
+            pickle.dump((stamp, dict(results)), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        pass
+
+
 def get_graph_statistics(graph: Graph) -> Dict[str, Any]:
     """Return the fields the GUI expects."""
     total_cities = len(graph.cities)
@@ -4,9 +4,19 @@ Provides heuristic calculations for informed search algorithms
 """
 
 import math
-from typing import Tuple
+from typing import Dict, List, Optional, Sequence, Tuple
 from code.heartofitall.graph import Graph
 
+# NumPy (see requirements.txt) vectorizes the per-goal heuristic tables;
+# without it haversine_to_goal falls back to a scalar loop
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover
+    np = None
+
+# Radius of Earth in miles, shared by every haversine variant below
+EARTH_RADIUS_MILES = 3956  # Use 6371 for kilometers
+
 
 def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
     """
@@ -22,17 +32,73 @@ def haversine_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     """
     # Convert latitude and longitude to radians
     lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
+    return _haversine_radians(lat1, lon1, math.cos(lat1), lat2, lon2, math.cos(lat2))
 
+
+def _haversine_radians(lat1: float, lon1: float, cos_lat1: float,
+                       lat2: float, lon2: float, cos_lat2: float) -> float:
+    """haversine_distance for coordinates already in radians, with the cosines of the latitudes"""
     # Haversine formula
     dlat = lat2 - lat1
     dlon = lon2 - lon1
-    a = math.sin(dlat / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon / 2) ** 2
+    a = math.sin(dlat / 2) ** 2 + cos_lat1 * cos_lat2 * math.sin(dlon / 2) ** 2
     c = 2 * math.asin(math.sqrt(a))
 
-    # Radius of Earth in miles
-    r = 3956  # Use 6371 for kilometers
+    return c * EARTH_RADIUS_MILES
+
+
+def haversine_vec(lat1, lon1, lat2: float, lon2: float):
+    """
+    Vectorized haversine_distance: many points to one point, using NumPy
+    array ops instead of one math.asin call per point. Requires NumPy.
+
+    Args:
+        lat1, lon1: Arrays (or sequences) of coordinates (in degrees)
+        lat2, lon2: Coordinates of the single target point (in degrees)
+
+    Returns:
+        np.ndarray of distances in miles
+    """
+    lat1 = np.radians(np.asarray(lat1, dtype=np.float64))
+    lon1 = np.radians(np.asarray(lon1, dtype=np.float64))
+    lat2 = math.radians(lat2)
+    lon2 = math.radians(lon2)
+
+    dlat = lat2 - lat1
+    dlon = lon2 - lon1
+    a = np.sin(dlat / 2) ** 2 + np.cos(lat1) * math.cos(lat2) * np.sin(dlon / 2) ** 2
+    c = 2 * np.arcsin(np.sqrt(a))
 
-    return c * r
+    return c * EARTH_RADIUS_MILES
+
+
+def haversine_to_goal(lats: Sequence[float], lons: Sequence[float], goal: int) -> List[float]:
+    """
+    Haversine distance from every node to one goal node in a single pass.
+    Uses haversine_vec when NumPy is available, otherwise haversine_distance's
+    formula with the goal terms hoisted out of the loop.
+
+    Args:
+        lats, lons: Coordinates indexed by node id (in degrees)
+        goal: Node id of the goal
+
+    Returns:
+        List of distances in miles, indexed by node id
+        (a plain list: the searches index it one element at a time)
+    """
+    if np is not None:
+        return haversine_vec(lats, lons, lats[goal], lons[goal]).tolist()
+
+    radians, cos = math.radians, math.cos
+    lat2 = radians(lats[goal])
+    lon2 = radians(lons[goal])
+    cos_lat2 = cos(lat2)
+
+    h = []
+    for lat1, lon1 in zip(lats, lons):
+        lat1 = radians(lat1)
+        h.append(_haversine_radians(lat1, radians(lon1), cos(lat1), lat2, lon2, cos_lat2))
+    return h
 
 
 def euclidean_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> float:
@@ -72,6 +138,11 @@ def manhattan_distance(lat1: float, lon1: float, lat2: float, lon2: float) -> fl
     return dx + dy
 
 
+def _pair_key(i: int, j: int) -> int:
+    """One int for the unordered pair of node ids {i, j} (the heuristics are symmetric)"""
+    return (i << 32) | j if i < j else (j << 32) | i
+
+
 class HeuristicCalculator:
     """
     Manages heuristic calculations for a graph.
@@ -89,7 +160,10 @@ class HeuristicCalculator:
         """
         self.graph = graph
         self.heuristic_type = heuristic_type
-        self._cache = {}
+        # _pair_key(id1, id2) -> distance
+        self._cache: Dict[int, float] = {}
+        # (lats, lons, cos(lats)) in radians indexed by node id, built on the first haversine lookup
+        self._radians: Optional[Tuple[List[float], List[float], List[float]]] = None
 
         # Select heuristic function
         if heuristic_type == "haversine":
@@ -113,21 +187,37 @@ class HeuristicCalculator:
             Heuristic distance in miles
         """
         # Check cache
-        cache_key = tuple(sorted([city1, city2]))
-        if cache_key in self._cache:
-            return self._cache[cache_key]
+        i = self.graph.get_node_id(city1)
+        j = self.graph.get_node_id(city2)
+        cache_key = _pair_key(i, j)
+        distance = self._cache.get(cache_key)
+        if distance is not None:
+            return distance
 
         # Calculate heuristic
-        lat1, lon1 = self.graph.get_coordinates(city1)
-        lat2, lon2 = self.graph.get_coordinates(city2)
-
-        distance = self.heuristic_func(lat1, lon1, lat2, lon2)
+        if self.heuristic_type == "haversine":
+            # same formula on radians (and latitude cosines) computed once per node,
+            # not four radians and two cos calls per lookup
+            lats, lons, cos_lats = self._radian_arrays()
+            distance = _haversine_radians(lats[i], lons[i], cos_lats[i], lats[j], lons[j], cos_lats[j])
+        else:
+            lat1, lon1 = self.graph.get_coordinates(city1)
+            lat2, lon2 = self.graph.get_coordinates(city2)
+            distance = self.heuristic_func(lat1, lon1, lat2, lon2)
 
         # Cache the result
         self._cache[cache_key] = distance
 
         return distance
 
+    def _radian_arrays(self) -> Tuple[List[float], List[float], List[float]]:
+        if self._radians is None:
+            lats, lons = self.graph.get_coordinate_arrays()
+            radians = math.radians
+            lat_rad = [radians(x) for x in lats]
+            self._radians = (lat_rad, [radians(x) for x in lons], [math.cos(x) for x in lat_rad])
+        return self._radians
+
     def precompute_all_heuristics(self, goal: str):
         """
         Precompute heuristics from all cities to a goal city.
@@ -139,9 +229,30 @@ class HeuristicCalculator:
         Returns:
             Dictionary mapping each city to its heuristic distance to goal
         """
+        if self.heuristic_type != "haversine":
+            heuristics = {}
+            for city in self.graph.get_all_cities():
+                heuristics[city] = self.get_heuristic(city, goal)
+            return heuristics
+
+        # one haversine_to_goal pass over the graph's id-indexed coordinates,
+        # instead of a haversine_distance call (and cache lookup) per city
+        graph = self.graph
+        coords = graph.get_coordinate_matrix()
+        if coords is not None:
+            lats, lons = coords[:, 0], coords[:, 1]
+        else:
+            lats, lons = graph.get_coordinate_arrays()
+        goal_id = graph.get_node_id(goal)
+        h = haversine_to_goal(lats, lons, goal_id)
+
         heuristics = {}
-        for city in self.graph.get_all_cities():
-            heuristics[city] = self.get_heuristic(city, goal)
+        for city in graph.get_all_cities():
+            node_id = graph.get_node_id(city)
+            distance = h[node_id]
+            heuristics[city] = distance
+            # later get_heuristic calls for this goal are cache hits
+            self._cache[_pair_key(node_id, goal_id)] = distance
         return heuristics
 
     def is_admissible(self, city1: str, city2: str) -> bool:
@@ -9,7 +9,11 @@ or many algorithms and return comparable SearchResult objects.
 from __future__ import annotations
 from dataclasses import dataclass, field
 from typing import Dict, List, Callable, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from functools import lru_cache
+import multiprocessing
+import os
+import threading
 
 
 try:
@@ -20,6 +24,7 @@ try:
     from code.algorithms.astar import AStar
     from code.algorithms.ids import IDS
     from code.algorithms.idastar import IDAStar
+    from code.algorithms.base_algorithm import SearchContext, prepare_search_context
     from code.heartofitall.graph import Graph
     from code.heartofitall.search_results import SearchResult
 except Exception:  # pragma: no cover
@@ -30,6 +35,7 @@ except Exception:  # pragma: no cover
     from code.algorithms.astar import AStar
     from code.algorithms.ids import IDS
     from code.algorithms.idastar import IDAStar
+    from code.algorithms.base_algorithm import SearchContext, prepare_search_context
     from code.heartofitall.graph import Graph
     from code.heartofitall.search_results import SearchResult
 
@@ -61,6 +67,8 @@ ALGO_NAME_MAPPING = {
 }
 
 
+# pure function of a handful of labels, so each one is only resolved once
+@lru_cache(maxsize=128)
 def normalize_algorithm_name(name: str) -> str:
     """
     Normalize algorithm name to match registry keys.
@@ -100,21 +108,28 @@ class ComparisonResult:
 
     def _compute_metrics(self):
         """Compute optimal, fastest, and least expanded algorithms"""
-        feasible = [r for r in self.results if r.path]
-
-        if not feasible:
+        # One pass over the feasible results; ties keep the earliest result, like min()
+        optimal: List[str] = []
+        min_cost = fastest = least_expanded = None
+        for r in self.results:
+            if not r.path:
+                continue
+            # optimal algorithms: those with the minimum cost
+            if min_cost is None or r.cost < min_cost:
+                min_cost = r.cost
+                optimal = [r.algorithm_name]
+            elif r.cost == min_cost:
+                optimal.append(r.algorithm_name)
+            if fastest is None or r.runtime < fastest.runtime:
+                fastest = r
+            if least_expanded is None or r.nodes_expanded < least_expanded.nodes_expanded:
+                least_expanded = r
+
+        if min_cost is None:
             return
 
-        # Find optimal algorithms (those with minimum cost)
-        min_cost = min(r.cost for r in feasible)
-        self.optimal_algorithms = [r.algorithm_name for r in feasible if r.cost == min_cost]
-
-        # Find fastest algorithm
-        fastest = min(feasible, key=lambda r: r.runtime)
+        self.optimal_algorithms = optimal
         self.fastest_algorithm = fastest.algorithm_name
-
-        # Find algorithm that expanded fewest nodes
-        least_expanded = min(feasible, key=lambda r: r.nodes_expanded)
         self.least_expanded_algorithm = least_expanded.algorithm_name
 
     def best_by_cost(self) -> Optional[SearchResult]:
@@ -128,15 +143,66 @@ class ComparisonResult:
         return min(feasible, key=lambda r: r.runtime, default=None)
 
 
+# Worker-process side of run_comparison(parallel=True): the graph is sent once per
+# worker through the pool initializer rather than pickled with every task
+_worker_planner: Optional["RoutePlanner"] = None
+
+
+def _init_worker(graph: Graph) -> None:
+    global _worker_planner
+    _worker_planner = RoutePlanner(graph)
+
+
+def _run_in_worker(algorithm_name: str, start: str, goal: str) -> SearchResult:
+    return _worker_planner.run_single_algorithm(algorithm_name, start, goal)
+
+
 class RoutePlanner:
     def __init__(self, graph: Graph):
         self.graph = graph
+        # worker processes of parallel comparisons, started on first use and kept for
+        # later ones (close() shuts them down); each holds a copy of the graph as it was then
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        # the GUI submits from several QThreadPool threads at once
+        self._pool_lock = threading.Lock()
+        # set by close(), so a late submission can't start a fresh pool
+        self._closed = False
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        with self._pool_lock:
+            if self._closed:
+                raise RuntimeError("RoutePlanner is closed, no worker processes can be started")
+            if self._process_pool is None:
+                # spawned, not forked: the GUI process already runs Qt and pool threads
+                self._process_pool = ProcessPoolExecutor(
+                    max_workers=min(len(ALGO_REGISTRY), os.cpu_count() or 1),
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_worker, initargs=(self.graph,)
+                )
+            return self._process_pool
+
+    def close(self) -> None:
+        """
+        Shut down the worker processes of parallel comparisons, if any were started.
+        The planner can't run searches in worker processes afterwards.
+        """
+        with self._pool_lock:
+            self._closed = True
+            if self._process_pool is not None:
+                # searches not started yet are dropped, running ones are waited for
+                self._process_pool.shutdown(cancel_futures=True)
+                self._process_pool = None
 
     def list_algorithms(self) -> List[str]:
         return list(ALGO_REGISTRY.keys())
 
-    def run_single_algorithm(self, algorithm_name: str, start: str, goal: str) -> SearchResult:
-        """Run a single algorithm and return its SearchResult."""
+    def run_single_algorithm(self, algorithm_name: str, start: str, goal: str,
+                             ctx: Optional[SearchContext] = None) -> SearchResult:
+        """
+        Run a single algorithm and return its SearchResult.
+        Pass a ctx from prepare_search_context to reuse the CSR / heuristic table
+        of an earlier run on the same (start, goal).
+        """
         # Normalize the algorithm name to handle different formats
         normalized_name = normalize_algorithm_name(algorithm_name)
 
@@ -144,7 +210,7 @@ class RoutePlanner:
             raise ValueError(f"Unknown algorithm: {algorithm_name} (normalized to: {normalized_name})")
 
         algo_cls = ALGO_REGISTRY[normalized_name]
-        result = algo_cls(self.graph, start, goal).search()
+        result = algo_cls(self.graph, start, goal, ctx=ctx).search()
 
         # Conservative optimality annotation for the GUI
         if normalized_name in ("UCS", "A*"):
@@ -154,10 +220,19 @@ class RoutePlanner:
 
         return result
 
+    def submit_single_algorithm(self, algorithm_name: str, start: str, goal: str) -> "Future[SearchResult]":
+        """
+        Run a single algorithm in the planner's worker processes.
+        Returns a Future of its SearchResult; the worker builds its own search context.
+        """
+        return self._get_process_pool().submit(_run_in_worker, algorithm_name, start, goal)
+
     def run_comparison(self, start: str, goal: str, algorithms: List[str], parallel: bool = False) -> ComparisonResult:
         """
         Run multiple algorithms and return a ComparisonResult object.
-        If `parallel` is True, algorithms are executed in a small thread pool.
+        If `parallel` is True, algorithms are executed in a process pool, so
+        CPU-bound searches (IDS / IDA* on far apart cities) run side by side
+        instead of taking turns on the GIL.
         """
         # Normalize algorithm names before checking registry
         normalized_algos = [normalize_algorithm_name(a) for a in algorithms]
@@ -168,14 +243,17 @@ class RoutePlanner:
 
         results: List[SearchResult] = []
 
-        if parallel:
-            with ThreadPoolExecutor(max_workers=min(4, len(to_run))) as ex:
-                futs = {ex.submit(self.run_single_algorithm, a, start, goal): a for a in to_run}
-                for fut in as_completed(futs):
-                    results.append(fut.result())
+        workers = min(len(to_run), os.cpu_count() or 1)
+        if parallel and workers > 1:
+            # each worker builds its own search context, a ctx can't be shared across processes
+            futs = [self.submit_single_algorithm(a, start, goal) for a in to_run]
+            for fut in as_completed(futs):
+                results.append(fut.result())
         else:
+            # every algorithm shares one set of id lookups and heuristic table
+            ctx = prepare_search_context(self.graph, start, goal)
             for a in to_run:
-                results.append(self.run_single_algorithm(a, start, goal))
+                results.append(self.run_single_algorithm(a, start, goal, ctx))
 
         order = {name: i for i, name in enumerate(to_run)}
         results.sort(key=lambda r: order.get(r.algorithm_name, 999))
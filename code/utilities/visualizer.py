@@ -3,14 +3,14 @@ Graph Visualization Module
 Provides visualization capabilities for the route planner
 """
 
-import matplotlib.pyplot as plt
-import matplotlib.patches as patches
-from matplotlib.backends.backend_qtagg import FigureCanvasQTAgg as FigureCanvas
+# only the backend-independent Figure API is used here: no pyplot / Qt imports,
+# so the visualizer (and export_graph) also work headless
 from matplotlib.figure import Figure
+from matplotlib.backend_bases import TimerBase
+from matplotlib.colors import to_rgba, to_rgba_array
 import networkx as nx
 import numpy as np
 from typing import List, Optional, Dict, Tuple
-import math
 
 from code.heartofitall.graph import Graph
 from code.heartofitall.search_results import SearchResult
@@ -19,36 +19,49 @@ from code.heartofitall.search_results import SearchResult
 class GraphVisualizer:
     def __init__(self, graph: Graph, figure: Optional["Figure"] = None):
         self.graph = graph
+        self.pos: Dict[str, Tuple[float, float]] = {}
         self.G = self._create_networkx_graph()
-        self.pos = {}
+        # built from self.G on first use; G itself is a snapshot taken here, so they stay valid
+        self._default_node_colors: Optional[List[str]] = None
+        self._edge_labels: Optional[Dict[Tuple[str, str], object]] = None
+        # artists of the latest draw_graph, reused by animate_search
+        self._node_artist = None
+        self._label_artists: Dict[str, object] = {}
+        self._animation_timer = None
         from matplotlib.figure import Figure
         self.figure: Figure = figure or Figure(figsize=(10, 8))
         self.ax = self.figure.add_subplot(111)
-        self._setup_positions()
 
     def _create_networkx_graph(self) -> nx.Graph:
-        """Convert our Graph to NetworkX format"""
+        """Convert our Graph to NetworkX format, filling self.pos on the way"""
         G = nx.Graph()
 
-        # Add nodes with position data
-        for city_name, city in self.graph.cities.items():
-            G.add_node(city_name, pos=(city.longitude, city.latitude))
+        # Node positions from the geographic coordinates (lon as x, lat as y), built
+        # once and shared by the node 'pos' attributes and the drawing calls
+        self.pos = {city_name: (city.longitude, city.latitude)
+                    for city_name, city in self.graph.cities.items()}
+        G.add_nodes_from((city_name, {'pos': xy}) for city_name, xy in self.pos.items())
 
-        # Add edges with weights
+        # Add edges with weights, each undirected pair once with the first distance seen
+        # (deduplicated up front, then added in one batch instead of a has_edge per entry)
+        seen = set()
+        edges = []
         for city_a, neighbors in self.graph.adjacency.items():
             for city_b, distance in neighbors.items():
-                if not G.has_edge(city_a, city_b):  # Avoid duplicate edges
-                    G.add_edge(city_a, city_b, weight=distance)
+                key = (city_a, city_b) if city_a <= city_b else (city_b, city_a)
+                if key in seen:
+                    continue
+                seen.add(key)
+                edges.append((city_a, city_b, distance))
+        G.add_weighted_edges_from(edges)
 
         return G
 
-    def _setup_positions(self):
-        """Setup node positions based on geographic coordinates"""
-        # Use actual lat/lon for positioning
-        self.pos = {}
-        for city_name, city in self.graph.cities.items():
-            # Convert to x,y coordinates (flip lon/lat for standard x,y display)
-            self.pos[city_name] = (city.longitude, city.latitude)
+    def path_coordinates(self, path: List[str]) -> Tuple[np.ndarray, np.ndarray]:
+        """(lons, lats) of the cities on a path, gathered with one fancy index"""
+        idx = np.fromiter((self.graph.get_node_id(c) for c in path), dtype=np.intp, count=len(path))
+        latlon = self.graph.get_coordinate_matrix()[idx]
+        return latlon[:, 1], latlon[:, 0]
 
     def create_figure(self, figsize: Tuple[int, int] = (14, 10)) -> Figure:
         """Create a matplotlib figure for the graph"""
@@ -60,7 +73,8 @@ class GraphVisualizer:
                    highlight_path: Optional[List[str]] = None,
                    show_weights: bool = True,
                    node_colors: Optional[Dict[str, str]] = None,
-                   title: str = "United States Route Network"):
+                   title: str = "United States Route Network",
+                   ax=None):
         """
         Draw the graph with optional path highlighting
 
@@ -69,28 +83,29 @@ class GraphVisualizer:
             show_weights: Whether to show edge weights
             node_colors: Custom colors for specific nodes
             title: Title for the graph
+            ax: Axes to draw on instead of self.ax (e.g. an offscreen figure's)
         """
-        if self.ax is None:
-            self.create_figure()
+        if ax is None:
+            if self.ax is None:
+                self.create_figure()
+            ax = self.ax
 
-        self.ax.clear()
+        ax.clear()
 
         # Default node colors
-        node_color_list = []
-        for node in self.G.nodes():
-            if node_colors and node in node_colors:
-                node_color_list.append(node_colors[node])
-            elif node == "Rochester":
-                node_color_list.append('#ff6b6b')  # Red for Rochester (start)
-            else:
-                node_color_list.append('#f9f4ee')  # Teal for other cities
+        if node_colors:
+            node_color_list = self._node_color_list(node_colors)
+        else:
+            if self._default_node_colors is None:
+                self._default_node_colors = self._node_color_list(None)
+            node_color_list = self._default_node_colors
 
         # Draw all edges first (in gray)
         nx.draw_networkx_edges(self.G, self.pos,
                                edge_color='black',
                                width=1.5,
                                alpha=0.5,
-                               ax=self.ax)
+                               ax=ax)
 
         # Highlight path if provided
         if highlight_path and len(highlight_path) > 1:
@@ -101,44 +116,57 @@ class GraphVisualizer:
                                    edge_color='red',
                                    width=3,
                                    alpha=0.8,
-                                   ax=self.ax)
+                                   ax=ax)
 
         # Draw nodes
-        nx.draw_networkx_nodes(self.G, self.pos,
-                               node_color=node_color_list,
-                               node_size=500,
-                               ax=self.ax)
+        self._node_artist = nx.draw_networkx_nodes(self.G, self.pos,
+                                                   node_color=node_color_list,
+                                                   node_size=500,
+                                                   ax=ax)
 
         # Draw labels
-        nx.draw_networkx_labels(self.G, self.pos,
-                                font_size=5,
-                                font_weight='bold',
-                                ax=self.ax)
+        self._label_artists = nx.draw_networkx_labels(self.G, self.pos,
+                                                      font_size=5,
+                                                      font_weight='bold',
+                                                      ax=ax)
 
         # Draw edge weights if requested
         if show_weights:
-            edge_labels = nx.get_edge_attributes(self.G, 'weight')
-            # Format edge labels to show as integers if they're whole numbers
-            edge_labels = {k: int(v) if v == int(v) else f"{v:.1f}"
-                           for k, v in edge_labels.items()}
+            if self._edge_labels is None:
+                edge_labels = nx.get_edge_attributes(self.G, 'weight')
+                # Format edge labels to show as integers if they're whole numbers
+                self._edge_labels = {k: int(v) if v == int(v) else f"{v:.1f}"
+                                     for k, v in edge_labels.items()}
             nx.draw_networkx_edge_labels(self.G, self.pos,
-                                         edge_labels=edge_labels,
+                                         edge_labels=self._edge_labels,
                                          font_size=7,
-                                         ax=self.ax)
+                                         ax=ax)
 
-        self.ax.set_title(title, fontsize=14, fontweight='bold')
-        self.ax.set_xlabel('Longitude', fontsize=10)
-        self.ax.set_ylabel('Latitude', fontsize=10)
-        self.ax.grid(True, alpha=0.3)
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.set_xlabel('Longitude', fontsize=10)
+        ax.set_ylabel('Latitude', fontsize=10)
+        ax.grid(True, alpha=0.3)
 
         # Set equal aspect ratio for geographic accuracy
-        self.ax.set_aspect('equal', adjustable='box')
+        ax.set_aspect('equal', adjustable='box')
 
-        return self.figure
+        return ax.figure
+
+    def _node_color_list(self, node_colors: Optional[Dict[str, str]]) -> List[str]:
+        """Fill color of every node of self.G, in node order"""
+        node_color_list = []
+        for node in self.G.nodes():
+            if node_colors and node in node_colors:
+                node_color_list.append(node_colors[node])
+            elif node == "Rochester":
+                node_color_list.append('#ff6b6b')  # Red for Rochester (start)
+            else:
+                node_color_list.append('#f9f4ee')  # Teal for other cities
+        return node_color_list
 
     def create_comparison_chart(self, results: List[SearchResult]) -> Figure:
         """Create bar charts comparing algorithm performance"""
-        fig = Figure(figsize=(14, 8))
+        fig = Figure(figsize=(14, 8), layout='constrained')
 
         # Extract data
         algorithms = [r.algorithm_name for r in results]
@@ -161,9 +189,7 @@ class GraphVisualizer:
         ax1.grid(axis='y', alpha=0.3)
 
         # Add value labels on bars
-        for bar, cost in zip(bars1, costs):
-            ax1.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 1,
-                     f'{cost:.1f}', ha='center', va='bottom', fontsize=8)
+        ax1.bar_label(bars1, fmt='%.1f', padding=2, fontsize=8)
 
         # Nodes Expanded comparison
         bars2 = ax2.bar(algorithms, nodes, color=colors)
@@ -171,9 +197,7 @@ class GraphVisualizer:
         ax2.set_ylabel('Number of Nodes')
         ax2.grid(axis='y', alpha=0.3)
 
-        for bar, node_count in zip(bars2, nodes):
-            ax2.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.5,
-                     str(node_count), ha='center', va='bottom', fontsize=8)
+        ax2.bar_label(bars2, fmt='%d', padding=2, fontsize=8)
 
         # Runtime comparison
         bars3 = ax3.bar(algorithms, times, color=colors)
@@ -181,9 +205,7 @@ class GraphVisualizer:
         ax3.set_ylabel('Time (ms)')
         ax3.grid(axis='y', alpha=0.3)
 
-        for bar, time in zip(bars3, times):
-            ax3.text(bar.get_x() + bar.get_width() / 2, bar.get_height() + 0.01,
-                     f'{time:.2f}', ha='center', va='bottom', fontsize=8)
+        ax3.bar_label(bars3, fmt='%.2f', padding=2, fontsize=8)
 
         # Add legend
         from matplotlib.patches import Patch
@@ -191,22 +213,99 @@ class GraphVisualizer:
             Patch(facecolor='green', label='Optimal'),
             Patch(facecolor='orange', label='Non-optimal')
         ]
-        fig.legend(handles=legend_elements, loc='upper right')
+        fig.legend(handles=legend_elements, loc='outside upper right')
 
         fig.suptitle('Algorithm Performance Comparison', fontsize=14, fontweight='bold')
-        fig.tight_layout(rect=[0, 0, 0.95, 0.96])
 
         return fig
 
     def animate_search(self, visited_order: List[str], path: List[str],
-                       delay: int = 100) -> None:
+                       delay: int = 100):
         """
-        Animate the search process (for future implementation)
-        Shows nodes being visited and final path
+        Animate the search process on self.figure's canvas: one visited node turns
+        orange per tick, then the final path is drawn in red.
+
+        The graph is drawn once; every frame restores the saved background and
+        blits only the node collection (with its labels) and the path, instead
+        of redrawing the whole network. The canvas' own timer drives the frames,
+        so an interactive canvas (e.g. FigureCanvasQTAgg) is needed to see them;
+        on one without an event loop, the final state is drawn straight away.
+
+        Returns:
+            The running matplotlib timer (stop() it to cancel), or None
         """
-        # This would require integration with the GUI event loop
-        # Placeholder for future animation capability
-        pass
+        if self._animation_timer is not None:
+            self._animation_timer.stop()
+            self._animation_timer = None
+
+        self.draw_graph(show_weights=False, title="Search Progress")
+        ax = self.ax
+        canvas = self.figure.canvas
+        nodes = self._node_artist
+        labels = list(self._label_artists.values())
+
+        node_index = {node: i for i, node in enumerate(self.G.nodes())}
+        rgba = to_rgba_array(nodes.get_facecolor()).copy()
+        if len(rgba) == 1:
+            rgba = np.repeat(rgba, len(node_index), axis=0)
+        visited_rgba = to_rgba('#ffa500')
+        order = [node_index[c] for c in visited_order if c in node_index]
+
+        lons, lats = self.path_coordinates(path) if len(path) > 1 else ((), ())
+        path_line, = ax.plot(lons, lats, color='red', linewidth=3, alpha=0.8)
+        path_line.set_visible(False)
+
+        # a plain TimerBase means there is no event loop to run the frames (e.g. Agg)
+        timer = canvas.new_timer(interval=delay)
+        if not canvas.supports_blit or type(timer) is TimerBase:
+            rgba[order] = visited_rgba
+            nodes.set_facecolor(rgba)
+            path_line.set_visible(True)
+            return None
+
+        # drawn in z-order like a full draw would: nodes, path, then labels on top
+        animated = sorted([nodes, path_line, *labels], key=lambda artist: artist.get_zorder())
+        for artist in animated:
+            artist.set_animated(True)
+
+        background = {}
+
+        def on_draw(event):
+            # full redraws (first show, resize) leave the animated artists out
+            background['image'] = canvas.copy_from_bbox(ax.bbox)
+            for artist in animated:
+                ax.draw_artist(artist)
+
+        draw_cid = canvas.mpl_connect('draw_event', on_draw)
+        canvas.draw()
+
+        step = [0]
+
+        def frame():
+            k = step[0]
+            if k < len(order):
+                rgba[order[k]] = visited_rgba
+            else:
+                path_line.set_visible(True)
+            nodes.set_facecolor(rgba)
+            canvas.restore_region(background['image'])
+            for artist in animated:
+                ax.draw_artist(artist)
+            canvas.blit(ax.bbox)
+            step[0] = k + 1
+            if k < len(order):
+                return True
+            # done: hand the artists back to ordinary full draws
+            canvas.mpl_disconnect(draw_cid)
+            for artist in animated:
+                artist.set_animated(False)
+            self._animation_timer = None
+            return False
+
+        timer.add_callback(frame)
+        timer.start()
+        self._animation_timer = timer
+        return timer
 
     def export_graph(self, filename: str, dpi: int = 150):
         """Export the current graph visualization to a file"""
@@ -219,7 +318,11 @@ class GraphVisualizer:
         if len(path) < 2:
             return 0.0
 
+        # same lookups as get_distance without the method call per step; added one by
+        # one, start to goal, so the float matches the algorithms' costs (sum() and
+        # NumPy's pairwise sum may round differently)
+        adjacency = graph.adjacency
         total = 0.0
-        for i in range(len(path) - 1):
-            total += graph.get_distance(path[i], path[i + 1])
+        for a, b in zip(path, path[1:]):
+            total += adjacency[a][b]
         return total
\ No newline at end of file